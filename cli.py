@@ -6,44 +6,48 @@ Use the literature manager directly from the command line without MCP.
 This provides all the functionality through simple commands.
 """
 
-import argparse
 import sys
 import os
-from pathlib import Path
+from functools import lru_cache
+from types import SimpleNamespace
 
-# Add src directory to path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
-
-from src.database import LiteratureDatabase, DatabaseError
-from src.utils import format_source_summary
-from src.models import VALID_SOURCE_TYPES, VALID_IDENTIFIER_TYPES, VALID_STATUS_VALUES, VALID_RELATION_TYPES
+# Only the import-free constants are loaded up front; the database and
+# formatting helpers are imported lazily inside the commands that need them,
+# so 'cli.py help' and argument errors never pay the sqlite3 import cost.
+from src._constants import VALID_SOURCE_TYPES, VALID_IDENTIFIER_TYPES, VALID_STATUS_VALUES, VALID_RELATION_TYPES
 
+@lru_cache(maxsize=1)
 def get_database():
-    """Get database instance from environment variable."""
+    """Get database instance from environment variable (cached per process)."""
+    from src.database import LiteratureDatabase, DatabaseError
+
     db_path = os.environ.get('LITERATURE_DB_PATH')
     if not db_path:
         print("❌ Error: LITERATURE_DB_PATH environment variable not set")
         print("Set it with: export LITERATURE_DB_PATH=/path/to/your/literature.db")
         sys.exit(1)
-    
-    if not Path(db_path).exists():
+
+    try:
+        return LiteratureDatabase(db_path)
+    except DatabaseError:
         print(f"❌ Error: Database not found at {db_path}")
         print("Create it with: python setup_database.py")
         sys.exit(1)
-    
-    return LiteratureDatabase(db_path)
 
 def cmd_add_source(args):
     """Add a new source."""
+    from src.database import DatabaseError
+    from src.utils import format_source_summary
+
     try:
         db = get_database()
         source_id = db.add_source(args.title, args.type, args.identifier_type, args.identifier_value)
         
-        # Add initial note if provided
+        # Add initial note if provided; add_note returns the updated source
         if args.note_title and args.note_content:
-            db.add_note(source_id, args.note_title, args.note_content)
-        
-        source = db.get_source_by_id(source_id)
+            source = db.add_note(source_id, args.note_title, args.note_content)
+        else:
+            source = db.get_source_by_id(source_id)
         print("✅ Successfully added source:")
         print(format_source_summary(source))
         
@@ -53,6 +57,9 @@ def cmd_add_source(args):
 
 def cmd_add_note(args):
     """Add a note to an existing source."""
+    from src.database import DatabaseError
+    from src.utils import format_source_summary
+
     try:
         db = get_database()
         source = db.find_source_by_identifier(args.identifier_type, args.identifier_value, args.type)
@@ -61,8 +68,7 @@ def cmd_add_note(args):
             print(f"❌ Source not found: {args.title}")
             sys.exit(1)
         
-        db.add_note(source['id'], args.note_title, args.note_content)
-        updated_source = db.get_source_by_id(source['id'])
+        updated_source = db.add_note(source['id'], args.note_title, args.note_content)
         
         print(f"✅ Added note '{args.note_title}' to {args.title}")
         print(format_source_summary(updated_source))
@@ -73,6 +79,9 @@ def cmd_add_note(args):
 
 def cmd_update_status(args):
     """Update source status."""
+    from src.database import DatabaseError
+    from src.utils import format_source_summary
+
     try:
         db = get_database()
         source = db.find_source_by_identifier(args.identifier_type, args.identifier_value, args.type)
@@ -81,8 +90,7 @@ def cmd_update_status(args):
             print(f"❌ Source not found: {args.title}")
             sys.exit(1)
         
-        db.update_status(source['id'], args.status)
-        updated_source = db.get_source_by_id(source['id'])
+        updated_source = db.update_status(source['id'], args.status)
         
         print(f"✅ Updated status of '{args.title}' to {args.status}")
         print(format_source_summary(updated_source))
@@ -93,6 +101,9 @@ def cmd_update_status(args):
 
 def cmd_link_entity(args):
     """Link source to entity."""
+    from src.database import DatabaseError
+    from src.utils import format_source_summary
+
     try:
         db = get_database()
         source = db.find_source_by_identifier(args.identifier_type, args.identifier_value, args.type)
@@ -101,8 +112,7 @@ def cmd_link_entity(args):
             print(f"❌ Source not found: {args.title}")
             sys.exit(1)
         
-        db.link_to_entity(source['id'], args.entity_name, args.relation_type, args.notes)
-        updated_source = db.get_source_by_id(source['id'])
+        updated_source = db.link_to_entity(source['id'], args.entity_name, args.relation_type, args.notes)
         
         print(f"✅ Linked '{args.title}' to entity '{args.entity_name}' with relation '{args.relation_type}'")
         print(format_source_summary(updated_source))
@@ -113,101 +123,108 @@ def cmd_link_entity(args):
 
 def cmd_show_source(args):
     """Show detailed source information."""
+    from src.database import DatabaseError
+    from src.utils import format_source_summary
+
     try:
         db = get_database()
-        source = db.find_source_by_identifier(args.identifier_type, args.identifier_value, args.type)
-        
-        if not source:
+        full_source = db.find_full_source_by_identifier(args.identifier_type, args.identifier_value, args.type)
+
+        if not full_source:
             print(f"❌ Source not found: {args.title}")
             sys.exit(1)
-        
-        full_source = db.get_source_by_id(source['id'])
-        print("📚 Source Details:")
-        print("=" * 50)
-        print(format_source_summary(full_source))
-        
+
+        # Build the whole report in memory and emit it with one write
+        lines = ["📚 Source Details:", "=" * 50, format_source_summary(full_source)]
+
         # Show detailed notes
         if full_source['notes']:
-            print("\n📝 Notes:")
+            lines.append("\n📝 Notes:")
             for note in full_source['notes']:
-                print(f"\n  📌 {note['title']}")
-                print(f"     {note['content']}")
-                print(f"     Created: {note['created_at']}")
-        
+                lines.append(f"\n  📌 {note['title']}")
+                lines.append(f"     {note['content']}")
+                lines.append(f"     Created: {note['created_at']}")
+
         # Show entity links
         if full_source['entity_links']:
-            print("\n🔗 Entity Links:")
+            lines.append("\n🔗 Entity Links:")
             for link in full_source['entity_links']:
-                print(f"  • {link['entity_name']} ({link['relation_type']})")
+                lines.append(f"  • {link['entity_name']} ({link['relation_type']})")
                 if link['notes']:
-                    print(f"    Notes: {link['notes']}")
-        
+                    lines.append(f"    Notes: {link['notes']}")
+
+        sys.stdout.write('\n'.join(lines) + '\n')
+
     except DatabaseError as e:
         print(f"❌ Error: {e}")
         sys.exit(1)
 
 def cmd_list_sources(args):
     """List sources with optional filtering."""
+    from src.database import DatabaseError
+    from src.models import TYPE_DISPLAY, STATUS_DISPLAY
+
     try:
         db = get_database()
-        sources = db.list_sources(args.type, args.status, args.limit)
-        
-        if not sources:
+
+        # Stream rows straight from the cursor, counting as we format
+        count = 0
+        lines = []
+        for row in db.iter_source_headers(args.type, args.status, args.limit):
+            count += 1
+            lines.append(f"{count}. {row['title']}")
+            lines.append(f"   Type: {TYPE_DISPLAY[row['type']]}, Status: {STATUS_DISPLAY[row['status']]}")
+            lines.append(f"   Created: {row['created_at']}")
+            lines.append("")
+
+        if count == 0:
             print("📚 No sources found")
             return
-        
+
         filter_desc = []
         if args.type:
             filter_desc.append(f"type={args.type}")
         if args.status:
             filter_desc.append(f"status={args.status}")
-        
+
         filter_text = f" (filtered by {', '.join(filter_desc)})" if filter_desc else ""
-        print(f"📚 Found {len(sources)} sources{filter_text}:")
-        print("=" * 50)
-        
-        for i, source in enumerate(sources, 1):
-            print(f"{i}. {source['title']}")
-            print(f"   Type: {source['type'].title()}, Status: {source['status'].title()}")
-            print(f"   Created: {source['created_at']}")
-            print()
-        
+
+        header = [f"📚 Found {count} sources{filter_text}:", "=" * 50]
+        sys.stdout.write('\n'.join(header + lines) + '\n')
+
     except DatabaseError as e:
         print(f"❌ Error: {e}")
         sys.exit(1)
 
 def cmd_search_sources(args):
     """Search sources by title."""
+    from src.database import DatabaseError
+    from src.models import TYPE_DISPLAY, STATUS_DISPLAY
+
     try:
         db = get_database()
-        all_sources = db.list_sources(limit=1000)
-        
-        # Simple search by title
-        query_lower = args.query.lower()
-        matches = []
-        
-        for source in all_sources:
-            if query_lower in source['title'].lower():
-                matches.append(source)
-        
+        matches = db.search_by_title(args.query, args.limit)
+
         if not matches:
             print(f"🔍 No sources found matching '{args.query}'")
             return
-        
-        print(f"🔍 Found {len(matches)} sources matching '{args.query}':")
-        print("=" * 50)
-        
-        for i, source in enumerate(matches[:args.limit], 1):
-            print(f"{i}. {source['title']}")
-            print(f"   Type: {source['type'].title()}, Status: {source['status'].title()}")
-            print()
-        
+
+        # Build the results in memory and emit them with one write
+        lines = [f"🔍 Found {len(matches)} sources matching '{args.query}':", "=" * 50]
+        for i, source in enumerate(matches, 1):
+            lines.append(f"{i}. {source['title']}")
+            lines.append(f"   Type: {TYPE_DISPLAY[source['type']]}, Status: {STATUS_DISPLAY[source['status']]}")
+            lines.append("")
+        sys.stdout.write('\n'.join(lines) + '\n')
+
     except DatabaseError as e:
         print(f"❌ Error: {e}")
         sys.exit(1)
 
 def cmd_stats(args):
     """Show database statistics."""
+    from src.database import DatabaseError
+
     try:
         db = get_database()
         stats = db.get_database_stats()
@@ -289,93 +306,153 @@ For more help, see: https://github.com/Amruth22/literature-manager-mcp
 """
     print(help_text)
 
+# Attributes validated against a fixed set of values
+CHOICES = {
+    'type': VALID_SOURCE_TYPES,
+    'identifier_type': VALID_IDENTIFIER_TYPES,
+    'status': VALID_STATUS_VALUES,
+    'relation_type': VALID_RELATION_TYPES,
+}
+
+# Attributes converted to int
+INT_ATTRS = {'limit'}
+
+# Command table: name -> (handler, positional attrs, flag map, defaults)
+COMMANDS = {
+    'add-source': (
+        cmd_add_source,
+        ('title', 'type', 'identifier_type', 'identifier_value'),
+        {'--note-title': 'note_title', '--note-content': 'note_content'},
+        {'note_title': None, 'note_content': None},
+    ),
+    'add-note': (
+        cmd_add_note,
+        ('title', 'type', 'identifier_type', 'identifier_value', 'note_title', 'note_content'),
+        {},
+        {},
+    ),
+    'update-status': (
+        cmd_update_status,
+        ('title', 'type', 'identifier_type', 'identifier_value', 'status'),
+        {},
+        {},
+    ),
+    'link-entity': (
+        cmd_link_entity,
+        ('title', 'type', 'identifier_type', 'identifier_value', 'entity_name', 'relation_type'),
+        {'--notes': 'notes'},
+        {'notes': None},
+    ),
+    'show': (
+        cmd_show_source,
+        ('title', 'type', 'identifier_type', 'identifier_value'),
+        {},
+        {},
+    ),
+    'list': (
+        cmd_list_sources,
+        (),
+        {'--type': 'type', '--status': 'status', '--limit': 'limit'},
+        {'type': None, 'status': None, 'limit': 20},
+    ),
+    'search': (
+        cmd_search_sources,
+        ('query',),
+        {'--limit': 'limit'},
+        {'limit': 10},
+    ),
+    'stats': (cmd_stats, (), {}, {}),
+    'help': (cmd_help, (), {}, {}),
+}
+
+def print_usage():
+    """Print short usage information."""
+    print("Usage: python cli.py <command> [arguments]")
+    print(f"Commands: {', '.join(COMMANDS)}")
+    print("Run 'python cli.py help' for detailed help and examples.")
+
+def parse_args(command, argv):
+    """
+    Parse command arguments into a simple namespace.
+
+    Args:
+        command: Name of the command being run
+        argv: Argument list after the command name
+
+    Returns:
+        SimpleNamespace with parsed arguments, or None on error
+    """
+    handler, positionals, flags, defaults = COMMANDS[command]
+    args = SimpleNamespace(**defaults)
+
+    pos_index = 0
+    i = 0
+    while i < len(argv):
+        token = argv[i]
+
+        if token.startswith('--'):
+            # Flag argument: --flag value
+            if token not in flags:
+                print(f"❌ Unknown option for '{command}': {token}")
+                return None
+            if i + 1 >= len(argv):
+                print(f"❌ Missing value for option: {token}")
+                return None
+            attr = flags[token]
+            value = argv[i + 1]
+            i += 2
+        else:
+            # Positional argument
+            if pos_index >= len(positionals):
+                print(f"❌ Unexpected argument for '{command}': {token}")
+                return None
+            attr = positionals[pos_index]
+            value = token
+            pos_index += 1
+            i += 1
+
+        if attr in INT_ATTRS:
+            try:
+                value = int(value)
+            except ValueError:
+                print(f"❌ Invalid number for {attr}: {value}")
+                return None
+
+        # Validate against known value sets
+        if attr in CHOICES and value is not None and value not in CHOICES[attr]:
+            print(f"❌ Invalid {attr}: {value}")
+            print(f"   Must be one of: {', '.join(sorted(CHOICES[attr]))}")
+            return None
+
+        setattr(args, attr, value)
+
+    if pos_index < len(positionals):
+        missing = positionals[pos_index:]
+        print(f"❌ Missing arguments for '{command}': {', '.join(missing)}")
+        return None
+
+    return args
+
 def main():
     """Main CLI entry point."""
-    parser = argparse.ArgumentParser(
-        description="Literature Manager - Direct Python CLI",
-        formatter_class=argparse.RawDescriptionHelpFormatter
-    )
-    
-    subparsers = parser.add_subparsers(dest='command', help='Available commands')
-    
-    # Add source command
-    add_parser = subparsers.add_parser('add-source', help='Add a new source')
-    add_parser.add_argument('title', help='Source title')
-    add_parser.add_argument('type', choices=VALID_SOURCE_TYPES, help='Source type')
-    add_parser.add_argument('identifier_type', choices=VALID_IDENTIFIER_TYPES, help='Identifier type')
-    add_parser.add_argument('identifier_value', help='Identifier value')
-    add_parser.add_argument('--note-title', help='Initial note title')
-    add_parser.add_argument('--note-content', help='Initial note content')
-    add_parser.set_defaults(func=cmd_add_source)
-    
-    # Add note command
-    note_parser = subparsers.add_parser('add-note', help='Add a note to source')
-    note_parser.add_argument('title', help='Source title')
-    note_parser.add_argument('type', choices=VALID_SOURCE_TYPES, help='Source type')
-    note_parser.add_argument('identifier_type', choices=VALID_IDENTIFIER_TYPES, help='Identifier type')
-    note_parser.add_argument('identifier_value', help='Identifier value')
-    note_parser.add_argument('note_title', help='Note title')
-    note_parser.add_argument('note_content', help='Note content')
-    note_parser.set_defaults(func=cmd_add_note)
-    
-    # Update status command
-    status_parser = subparsers.add_parser('update-status', help='Update source status')
-    status_parser.add_argument('title', help='Source title')
-    status_parser.add_argument('type', choices=VALID_SOURCE_TYPES, help='Source type')
-    status_parser.add_argument('identifier_type', choices=VALID_IDENTIFIER_TYPES, help='Identifier type')
-    status_parser.add_argument('identifier_value', help='Identifier value')
-    status_parser.add_argument('status', choices=VALID_STATUS_VALUES, help='New status')
-    status_parser.set_defaults(func=cmd_update_status)
-    
-    # Link entity command
-    link_parser = subparsers.add_parser('link-entity', help='Link source to entity')
-    link_parser.add_argument('title', help='Source title')
-    link_parser.add_argument('type', choices=VALID_SOURCE_TYPES, help='Source type')
-    link_parser.add_argument('identifier_type', choices=VALID_IDENTIFIER_TYPES, help='Identifier type')
-    link_parser.add_argument('identifier_value', help='Identifier value')
-    link_parser.add_argument('entity_name', help='Entity name')
-    link_parser.add_argument('relation_type', choices=VALID_RELATION_TYPES, help='Relation type')
-    link_parser.add_argument('--notes', help='Optional notes about the relationship')
-    link_parser.set_defaults(func=cmd_link_entity)
-    
-    # Show source command
-    show_parser = subparsers.add_parser('show', help='Show source details')
-    show_parser.add_argument('title', help='Source title')
-    show_parser.add_argument('type', choices=VALID_SOURCE_TYPES, help='Source type')
-    show_parser.add_argument('identifier_type', choices=VALID_IDENTIFIER_TYPES, help='Identifier type')
-    show_parser.add_argument('identifier_value', help='Identifier value')
-    show_parser.set_defaults(func=cmd_show_source)
-    
-    # List sources command
-    list_parser = subparsers.add_parser('list', help='List sources')
-    list_parser.add_argument('--type', choices=VALID_SOURCE_TYPES, help='Filter by source type')
-    list_parser.add_argument('--status', choices=VALID_STATUS_VALUES, help='Filter by status')
-    list_parser.add_argument('--limit', type=int, default=20, help='Maximum number of results')
-    list_parser.set_defaults(func=cmd_list_sources)
-    
-    # Search sources command
-    search_parser = subparsers.add_parser('search', help='Search sources by title')
-    search_parser.add_argument('query', help='Search query')
-    search_parser.add_argument('--limit', type=int, default=10, help='Maximum number of results')
-    search_parser.set_defaults(func=cmd_search_sources)
-    
-    # Stats command
-    stats_parser = subparsers.add_parser('stats', help='Show database statistics')
-    stats_parser.set_defaults(func=cmd_stats)
-    
-    # Help command
-    help_parser = subparsers.add_parser('help', help='Show detailed help')
-    help_parser.set_defaults(func=cmd_help)
-    
-    # Parse arguments
-    args = parser.parse_args()
-    
-    if not args.command:
-        parser.print_help()
+    argv = sys.argv[1:]
+
+    if not argv or argv[0] in ('-h', '--help'):
+        print_usage()
         return
-    
+
+    command = argv[0]
+    if command not in COMMANDS:
+        print(f"❌ Unknown command: {command}")
+        print_usage()
+        sys.exit(2)
+
+    args = parse_args(command, argv[1:])
+    if args is None:
+        sys.exit(2)
+
     # Execute command
-    args.func(args)
+    COMMANDS[command][0](args)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
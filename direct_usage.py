@@ -8,77 +8,109 @@ without any MCP client. Perfect for automation, scripts, or Jupyter notebooks.
 
 import os
 import sys
+from collections import deque
 from pathlib import Path
 
-# Add src directory to path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
-
 from src.database import LiteratureDatabase, DatabaseError
 from src.utils import format_source_summary
 
-def setup_example():
-    """Set up example database and return database instance."""
-    
-    # Create example database
-    db_path = "direct_usage_example.db"
-    
-    # Remove existing database
+# Full example schema, executed as one script (tables, indexes, FTS)
+SCHEMA_SQL = """
+CREATE TABLE sources (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    type TEXT CHECK(type IN ('paper', 'webpage', 'book', 'video', 'blog')) NOT NULL,
+    identifiers TEXT NOT NULL,
+    status TEXT CHECK(status IN ('unread', 'reading', 'completed', 'archived')) DEFAULT 'unread',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    semantic_scholar_id TEXT GENERATED ALWAYS AS (json_extract(identifiers, '$.semantic_scholar')) STORED,
+    arxiv_id TEXT GENERATED ALWAYS AS (json_extract(identifiers, '$.arxiv')) STORED,
+    doi_id TEXT GENERATED ALWAYS AS (json_extract(identifiers, '$.doi')) STORED,
+    isbn_id TEXT GENERATED ALWAYS AS (json_extract(identifiers, '$.isbn')) STORED,
+    url_id TEXT GENERATED ALWAYS AS (json_extract(identifiers, '$.url')) STORED
+);
+
+CREATE TABLE source_notes (
+    source_id TEXT REFERENCES sources(id),
+    note_title TEXT NOT NULL,
+    content TEXT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (source_id, note_title)
+);
+
+CREATE TABLE source_entity_links (
+    source_id TEXT REFERENCES sources(id),
+    entity_name TEXT,
+    relation_type TEXT CHECK(relation_type IN ('discusses', 'introduces', 'extends', 'evaluates', 'applies', 'critiques')),
+    notes TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (source_id, entity_name)
+);
+
+CREATE INDEX idx_sources_type_status_created ON sources(type, status, created_at DESC);
+CREATE INDEX idx_sources_status_created ON sources(status, created_at DESC);
+CREATE INDEX idx_entity_links_name ON source_entity_links(entity_name);
+CREATE INDEX idx_sources_arxiv_id ON sources(arxiv_id) WHERE arxiv_id IS NOT NULL;
+CREATE INDEX idx_sources_isbn_id ON sources(isbn_id) WHERE isbn_id IS NOT NULL;
+CREATE INDEX idx_sources_url_id ON sources(url_id) WHERE url_id IS NOT NULL;
+
+CREATE VIRTUAL TABLE sources_fts USING fts5(
+    title,
+    content='sources',
+    content_rowid='rowid',
+    tokenize='unicode61'
+);
+
+CREATE TRIGGER sources_fts_insert AFTER INSERT ON sources BEGIN
+    INSERT INTO sources_fts(rowid, title) VALUES (new.rowid, new.title);
+END;
+
+CREATE TRIGGER sources_fts_delete AFTER DELETE ON sources BEGIN
+    INSERT INTO sources_fts(sources_fts, rowid, title)
+    VALUES ('delete', old.rowid, old.title);
+END;
+
+CREATE TRIGGER sources_fts_update AFTER UPDATE OF title ON sources BEGIN
+    INSERT INTO sources_fts(sources_fts, rowid, title)
+    VALUES ('delete', old.rowid, old.title);
+    INSERT INTO sources_fts(rowid, title) VALUES (new.rowid, new.title);
+END;
+"""
+
+def setup_example(db_path="direct_usage_example.db"):
+    """Set up the example database once and return a database instance."""
+
+    import sqlite3
+
+    # Reuse an existing database that already has the expected schema
     if Path(db_path).exists():
+        with sqlite3.connect(db_path) as conn:
+            tables = {row[0] for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type IN ('table', 'view')"
+            )}
+        if {'sources', 'source_notes', 'source_entity_links', 'sources_fts'} <= tables:
+            # Truncate rows from a previous run so the examples start
+            # from a clean slate instead of hitting duplicate errors
+            with sqlite3.connect(db_path) as conn:
+                conn.execute("DELETE FROM source_entity_links")
+                conn.execute("DELETE FROM source_notes")
+                conn.execute("DELETE FROM sources")
+                conn.commit()
+            return LiteratureDatabase(db_path)
         Path(db_path).unlink()
-    
-    # Create database schema
-    import sqlite3
-    
+
+    # Create the whole schema in one script call
     with sqlite3.connect(db_path) as conn:
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            CREATE TABLE sources (
-                id TEXT PRIMARY KEY,
-                title TEXT NOT NULL,
-                type TEXT CHECK(type IN ('paper', 'webpage', 'book', 'video', 'blog')) NOT NULL,
-                identifiers TEXT NOT NULL,
-                status TEXT CHECK(status IN ('unread', 'reading', 'completed', 'archived')) DEFAULT 'unread',
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        
-        cursor.execute("""
-            CREATE TABLE source_notes (
-                source_id TEXT REFERENCES sources(id),
-                note_title TEXT NOT NULL,
-                content TEXT NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                PRIMARY KEY (source_id, note_title)
-            )
-        """)
-        
-        cursor.execute("""
-            CREATE TABLE source_entity_links (
-                source_id TEXT REFERENCES sources(id),
-                entity_name TEXT,
-                relation_type TEXT CHECK(relation_type IN ('discusses', 'introduces', 'extends', 'evaluates', 'applies', 'critiques')),
-                notes TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                PRIMARY KEY (source_id, entity_name)
-            )
-        """)
-        
-        conn.commit()
-    
+        conn.executescript(SCHEMA_SQL)
+
     return LiteratureDatabase(db_path)
 
-def example_basic_usage():
+def example_basic_usage(db):
     """Show basic usage patterns."""
     
     print("📚 Direct Python Usage Examples")
     print("=" * 50)
     
-    # Initialize database
-    db = setup_example()
-    
-    print("✅ Database created and initialized")
-    
     # Example 1: Add sources
     print("\n1️⃣ Adding Sources")
     print("-" * 20)
@@ -197,22 +229,20 @@ def example_basic_usage():
         
     except DatabaseError as e:
         print(f"❌ Error retrieving data: {e}")
-    
-    return db
 
-def example_automation_script():
+def example_automation_script(db):
     """Show how to use for automation/batch processing."""
     
     print("\n🤖 Automation Example")
     print("=" * 30)
     
-    db = setup_example()
-    
     # Batch data to import
     papers_to_import = [
         {
             'title': 'BERT: Pre-training of Deep Bidirectional Transformers',
-            'arxiv': '1810.04805',
+            'source_type': 'paper',
+            'identifier_type': 'arxiv',
+            'identifier_value': '1810.04805',
             'notes': [
                 ('Bidirectional', 'Uses bidirectional training unlike GPT'),
                 ('Pre-training', 'Masked LM and Next Sentence Prediction tasks')
@@ -224,55 +254,53 @@ def example_automation_script():
         },
         {
             'title': 'GPT-3: Language Models are Few-Shot Learners',
-            'arxiv': '2005.14165',
+            'source_type': 'paper',
+            'identifier_type': 'arxiv',
+            'identifier_value': '2005.14165',
             'notes': [
                 ('Scale', '175 billion parameters, largest model at the time'),
                 ('Few-shot', 'Shows emergent few-shot learning capabilities')
             ],
             'entities': [
                 ('transformer architecture', 'extends'),
-                ('few-shot learning', 'demonstrates')
+                ('few-shot learning', 'applies')
             ]
         }
     ]
-    
+
     print(f"Importing {len(papers_to_import)} papers...")
-    
-    for paper_data in papers_to_import:
-        try:
-            # Add source
-            source_id = db.add_source(
-                title=paper_data['title'],
-                source_type='paper',
-                identifier_type='arxiv',
-                identifier_value=paper_data['arxiv']
-            )
-            
-            # Add notes
-            for note_title, note_content in paper_data['notes']:
-                db.add_note(source_id, note_title, note_content)
-            
-            # Add entity links
-            for entity_name, relation_type in paper_data['entities']:
-                db.link_to_entity(source_id, entity_name, relation_type)
-            
-            print(f"✅ Imported: {paper_data['title'][:40]}...")
-            
-        except DatabaseError as e:
-            print(f"❌ Failed to import {paper_data['title']}: {e}")
-    
+
+    try:
+        # One transaction for all sources, notes, and entity links
+        db.bulk_import(papers_to_import)
+
+        if sys.stdout.isatty():
+            # Buffer progress lines and flush in batches instead of
+            # printing (and flushing) once per imported paper
+            progress = deque()
+            for paper_data in papers_to_import:
+                progress.append(f"✅ Imported: {paper_data['title'][:40]}...")
+                if len(progress) >= 100:
+                    sys.stdout.write('\n'.join(progress) + '\n')
+                    progress.clear()
+            if progress:
+                sys.stdout.write('\n'.join(progress) + '\n')
+        else:
+            # Redirected output: skip the per-paper previews entirely
+            print(f"✅ Imported {len(papers_to_import)} papers")
+    except DatabaseError as e:
+        print(f"❌ Import failed: {e}")
+
     # Show final statistics
     stats = db.get_database_stats()
     print(f"\n📊 Final Stats: {stats['total_sources']} sources, {stats['total_notes']} notes")
 
-def example_search_and_filter():
+def example_search_and_filter(db):
     """Show search and filtering capabilities."""
     
     print("\n🔍 Search and Filter Example")
     print("=" * 35)
     
-    db = setup_example()
-    
     # Add some test data
     test_sources = [
         ("Transformer Paper 1", "paper", "arxiv", "1111.1111"),
@@ -308,22 +336,19 @@ def example_search_and_filter():
     for source in completed:
         print(f"   • {source['title']}")
     
-    # Search by title (simple implementation)
-    all_sources = db.list_sources(limit=100)
-    transformer_sources = [s for s in all_sources if 'transformer' in s['title'].lower()]
+    # Search by title in the database instead of scanning rows in Python
+    transformer_sources = db.search_by_title("transformer", limit=100)
     print(f"\n🔍 Sources with 'transformer': {len(transformer_sources)} found")
     for source in transformer_sources:
         print(f"   • {source['title']}")
 
-def example_jupyter_notebook_style():
+def example_jupyter_notebook_style(db):
     """Show how to use in Jupyter notebook style."""
     
     print("\n📓 Jupyter Notebook Style Usage")
     print("=" * 40)
     
-    # This is how you'd use it in a Jupyter notebook
-    db = setup_example()
-    
+
     # Cell 1: Add a source
     source_id = db.add_source("Example Paper", "paper", "arxiv", "1234.5678")
     print(f"Added source: {source_id}")
@@ -353,20 +378,38 @@ def example_jupyter_notebook_style():
     # df = pd.DataFrame(all_sources)
     # df.plot(kind='bar', x='type')
 
-def main():
-    """Run all examples."""
-    
+# Example names accepted on the command line, in run order
+EXAMPLES = {
+    'basic': example_basic_usage,
+    'automation': example_automation_script,
+    'search': example_search_and_filter,
+    'jupyter': example_jupyter_notebook_style,
+}
+
+def main(selected=None):
+    """Run the selected examples (all of them by default)."""
+
+    selected = selected or list(EXAMPLES)
+    unknown = [name for name in selected if name not in EXAMPLES]
+    if unknown:
+        print(f"❌ Unknown examples: {', '.join(unknown)}")
+        print(f"Available: {', '.join(EXAMPLES)}")
+        sys.exit(2)
+
     print("🐍 Literature Manager - Direct Python Usage")
     print("=" * 55)
     print("This shows how to use the literature manager directly in Python")
     print("without any MCP client - perfect for scripts and automation!")
-    
-    # Run examples
-    db = example_basic_usage()
-    example_automation_script()
-    example_search_and_filter()
-    example_jupyter_notebook_style()
-    
+
+    # Create the example database once and share its connection (and
+    # page cache) across all examples
+    with setup_example() as db:
+        print("✅ Database created and initialized")
+
+        # Run only the requested examples
+        for name in selected:
+            EXAMPLES[name](db)
+
     print("\n🎉 All examples completed!")
     print("\nFiles created:")
     print("- direct_usage_example.db (example database)")
@@ -377,4 +420,4 @@ def main():
     print("\nOr use the CLI: python cli.py --help")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main(sys.argv[1:])
\ No newline at end of file
@@ -9,19 +9,25 @@ import os
 import sys
 from pathlib import Path
 
-# Add src directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Prefer the installed package (pip install -e .); fall back to
+# inserting the project root only when running from a checkout
+try:
+    from src.database import LiteratureDatabase, DatabaseError
+    from src.utils import create_example_data, format_source_summary
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    from src.database import LiteratureDatabase, DatabaseError
+    from src.utils import create_example_data, format_source_summary
 
-from src.database import LiteratureDatabase, DatabaseError
-from src.utils import create_example_data, format_source_summary
-
-def setup_advanced_database():
+def setup_advanced_database(fresh=False):
     """Create a database with more complex example data."""
     
     db_path = "advanced_literature.db"
     
-    # Remove existing database
-    if Path(db_path).exists():
+    # The schema below is idempotent, so an existing file is reused
+    # (keeping its WAL mode and warmed pages) and just emptied of rows.
+    # Pass fresh=True to delete the file and start from scratch.
+    if fresh and Path(db_path).exists():
         Path(db_path).unlink()
     
     # Create database (simplified setup)
@@ -29,10 +35,17 @@ def setup_advanced_database():
     
     with sqlite3.connect(db_path) as conn:
         cursor = conn.cursor()
-        
+
+        # Write-ahead log plus relaxed sync: one log append per commit
+        # instead of rollback-journal fsyncs (persists in the db file)
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA cache_size=-20000")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+
         # Create tables
         cursor.execute("""
-            CREATE TABLE sources (
+            CREATE TABLE IF NOT EXISTS sources (
                 id TEXT PRIMARY KEY,
                 title TEXT NOT NULL,
                 type TEXT CHECK(type IN ('paper', 'webpage', 'book', 'video', 'blog')) NOT NULL,
@@ -43,7 +56,7 @@ def setup_advanced_database():
         """)
         
         cursor.execute("""
-            CREATE TABLE source_notes (
+            CREATE TABLE IF NOT EXISTS source_notes (
                 source_id TEXT REFERENCES sources(id),
                 note_title TEXT NOT NULL,
                 content TEXT NOT NULL,
@@ -53,7 +66,7 @@ def setup_advanced_database():
         """)
         
         cursor.execute("""
-            CREATE TABLE source_entity_links (
+            CREATE TABLE IF NOT EXISTS source_entity_links (
                 source_id TEXT REFERENCES sources(id),
                 entity_name TEXT,
                 relation_type TEXT CHECK(relation_type IN ('discusses', 'introduces', 'extends', 'evaluates', 'applies', 'critiques')),
@@ -63,6 +76,16 @@ def setup_advanced_database():
             )
         """)
         
+        # Indexes so GROUP BY / filter queries scan an index, not the table
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_sources_type ON sources(type)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_sources_status ON sources(status)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_entity_links_name ON source_entity_links(entity_name)")
+
+        # Truncate any rows from a previous run in one transaction
+        cursor.execute("DELETE FROM source_entity_links")
+        cursor.execute("DELETE FROM source_notes")
+        cursor.execute("DELETE FROM sources")
+
         conn.commit()
     
     return db_path
@@ -80,7 +103,7 @@ def example_1_batch_import():
     sources_to_import = [
         {
             'title': 'Attention Is All You Need',
-            'type': 'paper',
+            'source_type': 'paper',
             'identifier_type': 'arxiv',
             'identifier_value': '1706.03762',
             'notes': [
@@ -94,7 +117,7 @@ def example_1_batch_import():
         },
         {
             'title': 'BERT: Pre-training of Deep Bidirectional Transformers',
-            'type': 'paper',
+            'source_type': 'paper',
             'identifier_type': 'arxiv',
             'identifier_value': '1810.04805',
             'notes': [
@@ -108,7 +131,7 @@ def example_1_batch_import():
         },
         {
             'title': 'Deep Learning',
-            'type': 'book',
+            'source_type': 'book',
             'identifier_type': 'isbn',
             'identifier_value': '978-0262035613',
             'notes': [
@@ -122,32 +145,16 @@ def example_1_batch_import():
         }
     ]
     
-    imported_ids = []
-    
     try:
-        for source_data in sources_to_import:
-            print(f"\nImporting: {source_data['title']}")
-            
-            # Add the source
-            source_id = db.add_source(
-                title=source_data['title'],
-                source_type=source_data['type'],
-                identifier_type=source_data['identifier_type'],
-                identifier_value=source_data['identifier_value']
-            )
-            imported_ids.append(source_id)
-            print(f"  ✅ Added source: {source_id}")
-            
-            # Add notes
-            for note_title, note_content in source_data.get('notes', []):
-                db.add_note(source_id, note_title, note_content)
-                print(f"  📝 Added note: {note_title}")
-            
-            # Add entity links
-            for entity_name, relation_type, notes in source_data.get('entities', []):
-                db.link_to_entity(source_id, entity_name, relation_type, notes)
-                print(f"  🔗 Linked to entity: {entity_name} ({relation_type})")
-        
+        # Batch insert: sources, notes and links each go through one
+        # executemany inside a single transaction
+        imported_ids = db.bulk_import(sources_to_import)
+
+        for source_data, source_id in zip(sources_to_import, imported_ids):
+            print(f"\n✅ Imported: {source_data['title']} ({source_id})")
+            print(f"  📝 {len(source_data.get('notes', []))} notes, "
+                  f"🔗 {len(source_data.get('entities', []))} entity links")
+
         print(f"\n🎉 Successfully imported {len(imported_ids)} sources!")
         return db, imported_ids
         
@@ -169,8 +176,7 @@ def example_2_research_workflow(db, source_ids):
         # Step 1: Mark papers as "reading" when starting research
         print("Step 1: Starting to read papers...")
         for source_id in source_ids[:2]:  # First two papers
-            db.update_status(source_id, "reading")
-            source = db.get_source_by_id(source_id)
+            source = db.update_status(source_id, "reading")
             print(f"  📖 Now reading: {source['title']}")
         
         # Step 2: Add detailed notes as you read
@@ -185,8 +191,9 @@ def example_2_research_workflow(db, source_ids):
             ("Limitations", "Quadratic complexity with sequence length. Memory intensive for long sequences.")
         ]
         
-        for note_title, note_content in detailed_notes:
-            db.add_note(attention_id, note_title, note_content)
+        db.add_notes_bulk([(attention_id, title, content)
+                           for title, content in detailed_notes])
+        for note_title, _ in detailed_notes:
             print(f"  📝 Added detailed note: {note_title}")
         
         # Step 3: Connect related concepts
@@ -201,16 +208,15 @@ def example_2_research_workflow(db, source_ids):
             (attention_id, "multi-head attention", "introduces", "Key innovation allowing parallel attention")
         ]
         
+        db.link_to_entities_bulk(additional_connections)
         for source_id, entity, relation, notes in additional_connections:
-            db.link_to_entity(source_id, entity, relation, notes)
             source = db.get_source_by_id(source_id)
             print(f"  🔗 Connected '{source['title'][:30]}...' to '{entity}'")
         
         # Step 4: Mark completed papers
         print("\nStep 4: Completing papers...")
         for source_id in source_ids[:2]:
-            db.update_status(source_id, "completed")
-            source = db.get_source_by_id(source_id)
+            source = db.update_status(source_id, "completed")
             print(f"  ✅ Completed: {source['title']}")
         
         print("\n🎯 Research workflow completed!")
@@ -229,22 +235,12 @@ def example_3_knowledge_exploration(db):
         return
     
     try:
-        # Get all sources and analyze connections
-        all_sources = db.list_sources(limit=100)
-        
-        print(f"Total sources in database: {len(all_sources)}")
-        
-        # Analyze by type
-        type_counts = {}
-        status_counts = {}
-        
-        for source in all_sources:
-            source_type = source['type']
-            status = source['status']
-            
-            type_counts[source_type] = type_counts.get(source_type, 0) + 1
-            status_counts[status] = status_counts.get(status, 0) + 1
-        
+        # Let SQLite aggregate the counts with indexed GROUP BY scans
+        type_counts = db.count_by('type')
+        status_counts = db.count_by('status')
+
+        print(f"Total sources in database: {sum(type_counts.values())}")
+
         print("\nSources by type:")
         for source_type, count in type_counts.items():
             print(f"  {source_type.title()}: {count}")
@@ -253,52 +249,36 @@ def example_3_knowledge_exploration(db):
         for status, count in status_counts.items():
             print(f"  {status.title()}: {count}")
         
-        # Find sources with most notes
+        # Find sources with most notes (counted and sorted by SQLite)
         print("\nSources with most notes:")
-        sources_with_notes = []
-        
-        for source in all_sources:
-            full_source = db.get_source_by_id(source['id'])
-            note_count = len(full_source['notes'])
-            if note_count > 0:
-                sources_with_notes.append((full_source, note_count))
+        for title, note_count in db.top_sources_by_note_count(limit=3):
+            print(f"  📚 {title[:40]}... ({note_count} notes)")
         
-        # Sort by note count
-        sources_with_notes.sort(key=lambda x: x[1], reverse=True)
-        
-        for source, note_count in sources_with_notes[:3]:  # Top 3
-            print(f"  📚 {source['title'][:40]}... ({note_count} notes)")
-        
-        # Find most connected entities
+        # Most connected entities, aggregated by SQLite
         print("\nMost connected entities:")
-        entity_connections = {}
-        
-        for source in all_sources:
-            full_source = db.get_source_by_id(source['id'])
-            for link in full_source['entity_links']:
-                entity = link['entity_name']
-                entity_connections[entity] = entity_connections.get(entity, 0) + 1
-        
-        # Sort by connection count
-        sorted_entities = sorted(entity_connections.items(), key=lambda x: x[1], reverse=True)
-        
-        for entity, count in sorted_entities[:5]:  # Top 5
+        sorted_entities = db.most_connected_entities(limit=5)
+
+        for entity, count in sorted_entities:
             print(f"  🔗 {entity}: {count} connections")
         
-        # Show detailed view of most connected entity
+        # Show detailed view of most connected entity (one indexed JOIN)
         if sorted_entities:
             top_entity = sorted_entities[0][0]
             print(f"\nDetailed view of '{top_entity}':")
             
-            for source in all_sources:
-                full_source = db.get_source_by_id(source['id'])
-                for link in full_source['entity_links']:
-                    if link['entity_name'] == top_entity:
-                        print(f"  📄 {full_source['title'][:40]}... ({link['relation_type']})")
+            for linked in db.sources_linked_to_entity(top_entity):
+                print(f"  📄 {linked['title'][:40]}... ({linked['relation_type']})")
         
     except DatabaseError as e:
         print(f"❌ Exploration failed: {e}")
 
+# One formatted block per source; optional sections arrive pre-joined
+_SOURCE_MD_TEMPLATE = """### {title}
+- **Type**: {type}
+- **Status**: {status}{identifiers_block}{notes_block}{links_block}
+
+"""
+
 def example_4_export_summary(db):
     """Example 4: Export a research summary."""
     
@@ -312,82 +292,88 @@ def example_4_export_summary(db):
     try:
         # Generate a comprehensive summary
         stats = db.get_database_stats()
-        all_sources = db.list_sources(limit=100)
-        
-        summary_lines = []
-        summary_lines.append("# Literature Review Summary")
-        summary_lines.append(f"Generated on: {__import__('datetime').datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        summary_lines.append("")
-        
-        # Overview statistics
-        summary_lines.append("## Overview")
-        summary_lines.append(f"- Total Sources: {stats['total_sources']}")
-        summary_lines.append(f"- Total Notes: {stats['total_notes']}")
-        summary_lines.append(f"- Total Entity Links: {stats['total_entity_links']}")
-        summary_lines.append("")
-        
-        # Sources by type
-        if stats['sources_by_type']:
-            summary_lines.append("## Sources by Type")
-            for source_type, count in stats['sources_by_type'].items():
-                summary_lines.append(f"- {source_type.title()}: {count}")
-            summary_lines.append("")
-        
-        # Reading progress
-        if stats['sources_by_status']:
-            summary_lines.append("## Reading Progress")
-            for status, count in stats['sources_by_status'].items():
-                summary_lines.append(f"- {status.title()}: {count}")
-            summary_lines.append("")
-        
-        # Detailed source list
-        summary_lines.append("## Detailed Source List")
-        
-        for source in all_sources:
-            full_source = db.get_source_by_id(source['id'])
-            summary_lines.append(f"### {full_source['title']}")
-            summary_lines.append(f"- **Type**: {full_source['type'].title()}")
-            summary_lines.append(f"- **Status**: {full_source['status'].title()}")
-            
-            # Identifiers
-            if full_source['identifiers']:
-                id_parts = []
-                for id_type, id_value in full_source['identifiers'].items():
-                    id_parts.append(f"{id_type}: {id_value}")
-                summary_lines.append(f"- **Identifiers**: {', '.join(id_parts)}")
-            
-            # Notes
-            if full_source['notes']:
-                summary_lines.append(f"- **Notes** ({len(full_source['notes'])}):")
-                for note in full_source['notes']:
-                    summary_lines.append(f"  - **{note['title']}**: {note['content'][:100]}...")
-            
-            # Entity links
-            if full_source['entity_links']:
-                summary_lines.append(f"- **Connected Concepts** ({len(full_source['entity_links'])}):")
-                for link in full_source['entity_links']:
-                    summary_lines.append(f"  - {link['entity_name']} ({link['relation_type']})")
-            
-            summary_lines.append("")
-        
-        # Write summary to file
-        summary_content = '\n'.join(summary_lines)
+
         summary_file = "literature_summary.md"
-        
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            f.write(summary_content)
-        
+        line_count = 0
+
+        # Stream straight to disk instead of building the whole document
+        # in memory first; rows are consumed lazily from the database
+        with open(summary_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+
+            def emit(line=""):
+                nonlocal line_count
+                f.write(line)
+                f.write('\n')
+                line_count += 1
+
+            emit("# Literature Review Summary")
+            emit(f"Generated on: {__import__('datetime').datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+            emit()
+
+            # Overview statistics
+            emit("## Overview")
+            emit(f"- Total Sources: {stats['total_sources']}")
+            emit(f"- Total Notes: {stats['total_notes']}")
+            emit(f"- Total Entity Links: {stats['total_entity_links']}")
+            emit()
+
+            # Sources by type
+            if stats['sources_by_type']:
+                emit("## Sources by Type")
+                for source_type, count in stats['sources_by_type'].items():
+                    emit(f"- {source_type.title()}: {count}")
+                emit()
+
+            # Reading progress
+            if stats['sources_by_status']:
+                emit("## Reading Progress")
+                for status, count in stats['sources_by_status'].items():
+                    emit(f"- {status.title()}: {count}")
+                emit()
+
+            # Detailed source list, streamed from one combined query
+            emit("## Detailed Source List")
+
+            for full_source in db.iter_sources_full():
+                notes = full_source['notes']
+                links = full_source['entity_links']
+
+                identifiers_block = (
+                    f"\n- **Identifiers**: {full_source['identifiers_text']}"
+                    if full_source['identifiers_text'] else "")
+                notes_block = (
+                    f"\n- **Notes** ({len(notes)}):\n" + '\n'.join(
+                        f"  - **{note['title']}**: {note['content'][:100]}..."
+                        for note in notes)
+                    if notes else "")
+                links_block = (
+                    f"\n- **Connected Concepts** ({len(links)}):\n" + '\n'.join(
+                        f"  - {link['entity_name']} ({link['relation_type']})"
+                        for link in links)
+                    if links else "")
+
+                block = _SOURCE_MD_TEMPLATE.format(
+                    title=full_source['title'],
+                    type=full_source['type'].title(),
+                    status=full_source['status'].title(),
+                    identifiers_block=identifiers_block,
+                    notes_block=notes_block,
+                    links_block=links_block)
+                f.write(block)
+                line_count += block.count('\n')
+
         print(f"📄 Summary exported to: {summary_file}")
-        print(f"📊 Summary contains {len(summary_lines)} lines")
-        
-        # Show preview
+        print(f"📊 Summary contains {line_count} lines")
+
+        # Show preview by reading the head of the file back
         print("\nPreview (first 10 lines):")
-        for line in summary_lines[:10]:
-            print(f"  {line}")
-        
-        if len(summary_lines) > 10:
+        with open(summary_file, encoding='utf-8') as f:
+            for _, line in zip(range(10), f):
+                print(f"  {line.rstrip()}")
+
+        if line_count > 10:
             print("  ...")
-        
+
     except Exception as e:
         print(f"❌ Export failed: {e}")
 
@@ -397,13 +383,14 @@ def main():
     print("🚀 Literature Manager - Advanced Usage Examples")
     print("=" * 55)
     
-    # Run examples in sequence
+    # Run examples in sequence, sharing one database connection
     db, source_ids = example_1_batch_import()
     
     if db and source_ids:
-        example_2_research_workflow(db, source_ids)
-        example_3_knowledge_exploration(db)
-        example_4_export_summary(db)
+        with db:
+            example_2_research_workflow(db, source_ids)
+            example_3_knowledge_exploration(db)
+            example_4_export_summary(db)
     
     print("\n🎉 Advanced examples completed!")
     print("\nFiles created:")
@@ -10,19 +10,24 @@ import os
 import sys
 from pathlib import Path
 
-# Add src directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Prefer the installed package (pip install -e .); fall back to
+# inserting the project root only when running from a checkout
+try:
+    from src.database import LiteratureDatabase, DatabaseError
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    from src.database import LiteratureDatabase, DatabaseError
 
-from src.database import LiteratureDatabase, DatabaseError
-
-def setup_example_database():
+def setup_example_database(fresh=False):
     """Create an example database with sample data."""
     
     # Use a test database
     db_path = "example_literature.db"
     
-    # Remove existing database
-    if Path(db_path).exists():
+    # The schema below is idempotent, so an existing file is reused
+    # (keeping its WAL mode and warmed pages) and just emptied of rows.
+    # Pass fresh=True to delete the file and start from scratch.
+    if fresh and Path(db_path).exists():
         Path(db_path).unlink()
     
     # Create database (you would normally run setup_database.py)
@@ -31,10 +36,17 @@ def setup_example_database():
     
     with sqlite3.connect(db_path) as conn:
         cursor = conn.cursor()
-        
+
+        # Write-ahead log plus relaxed sync: one log append per commit
+        # instead of rollback-journal fsyncs (persists in the db file)
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA cache_size=-20000")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+
         # Create tables (simplified version)
         cursor.execute("""
-            CREATE TABLE sources (
+            CREATE TABLE IF NOT EXISTS sources (
                 id TEXT PRIMARY KEY,
                 title TEXT NOT NULL,
                 type TEXT CHECK(type IN ('paper', 'webpage', 'book', 'video', 'blog')) NOT NULL,
@@ -45,7 +57,7 @@ def setup_example_database():
         """)
         
         cursor.execute("""
-            CREATE TABLE source_notes (
+            CREATE TABLE IF NOT EXISTS source_notes (
                 source_id TEXT REFERENCES sources(id),
                 note_title TEXT NOT NULL,
                 content TEXT NOT NULL,
@@ -55,7 +67,7 @@ def setup_example_database():
         """)
         
         cursor.execute("""
-            CREATE TABLE source_entity_links (
+            CREATE TABLE IF NOT EXISTS source_entity_links (
                 source_id TEXT REFERENCES sources(id),
                 entity_name TEXT,
                 relation_type TEXT CHECK(relation_type IN ('discusses', 'introduces', 'extends', 'evaluates', 'applies', 'critiques')),
@@ -65,6 +77,16 @@ def setup_example_database():
             )
         """)
         
+        # Indexes so GROUP BY / filter queries scan an index, not the table
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_sources_type ON sources(type)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_sources_status ON sources(status)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_entity_links_name ON source_entity_links(entity_name)")
+
+        # Truncate any rows from a previous run in one transaction
+        cursor.execute("DELETE FROM source_entity_links")
+        cursor.execute("DELETE FROM source_notes")
+        cursor.execute("DELETE FROM sources")
+
         conn.commit()
     
     return db_path
@@ -298,14 +320,15 @@ def main():
     print("🚀 Literature Manager - Basic Usage Examples")
     print("=" * 50)
     
-    # Run examples in sequence
+    # Run examples in sequence, sharing one database connection
     db, source_ids = example_1_add_sources()
     
     if db and source_ids:
-        example_2_add_notes(db, source_ids)
-        example_3_update_status(db, source_ids)
-        example_4_entity_links(db, source_ids)
-        example_5_retrieve_data(db, source_ids)
+        with db:
+            example_2_add_notes(db, source_ids)
+            example_3_update_status(db, source_ids)
+            example_4_entity_links(db, source_ids)
+            example_5_retrieve_data(db, source_ids)
     
     print("\n🎉 Examples completed!")
     print("\nNext steps:")
@@ -10,15 +10,10 @@ import os
 import sys
 from pathlib import Path
 
-# Add src directory to Python path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
-
 from src.tools import mcp
 
-def main():
-    """Main entry point for the MCP server."""
-    
-    # Check if database path is set
+def _validate_env() -> str:
+    """Resolve and validate the database path once, before the server starts."""
     db_path = os.environ.get('LITERATURE_DB_PATH')
     if not db_path:
         print("❌ Error: LITERATURE_DB_PATH environment variable not set")
@@ -27,20 +22,28 @@ def main():
         print("\nOr create a new database first:")
         print("  python setup_database.py")
         sys.exit(1)
-    
-    # Check if database exists
+
     if not Path(db_path).exists():
         print(f"❌ Error: Database not found at {db_path}")
         print("\nPlease create the database first:")
         print("  python setup_database.py")
         sys.exit(1)
-    
+
+    return db_path
+
+def main():
+    """Main entry point for the MCP server."""
+
+    # One startup check; the tools reuse the already-resolved path instead
+    # of re-reading the environment or re-statting the file per call
+    db_path = _validate_env()
+
     print("🚀 Starting Literature Manager MCP Server...")
     print(f"📚 Database: {db_path}")
     print("✅ Server ready for connections!")
-    
+
     # Start the FastMCP server
     mcp.run()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -10,32 +10,36 @@ import sqlite3
 import os
 from pathlib import Path
 
-def create_database(db_path: str = "literature.db"):
+def create_schema(db_path):
     """
-    Create the literature management database with all required tables.
-    
+    Create the tables only (no indexes).
+
+    Keeping index creation separate means a bulk load can insert into
+    bare tables and build the indexes afterwards, which is several times
+    faster than maintaining every B-tree per row.
+
     Args:
-        db_path: Path where to create the database file
+        db_path: Path to the database file
     """
-    
-    # Convert to Path object for better handling
-    db_path = Path(db_path)
-    
-    # Check if database already exists
-    if db_path.exists():
-        response = input(f"Database {db_path} already exists. Overwrite? (y/N): ")
-        if response.lower() != 'y':
-            print("Setup cancelled.")
-            return
-        db_path.unlink()  # Delete existing database
-    
-    print(f"Creating database at: {db_path.absolute()}")
-    
-    # Create database and tables
     with sqlite3.connect(db_path) as conn:
         cursor = conn.cursor()
-        
+
+        # Performance settings; WAL persists in the database file itself
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-65536")
+
         # Create sources table
+        # type/status stay TEXT with CHECK constraints rather than integer
+        # ids into lookup tables: the strings are short enough to fit the
+        # record inline either way, and every existing database, test
+        # schema, and JSON payload expects the string values.
+        # Likewise id stays a TEXT UUID primary key instead of an INTEGER
+        # rowid alias: the UUID is the external identity handed to MCP
+        # clients and stored in existing note/link rows, and swapping it
+        # for rowids would force a migration of every deployed database
+        # for a few bytes per child row.
         print("Creating sources table...")
         cursor.execute("""
             CREATE TABLE sources (
@@ -44,10 +48,15 @@ def create_database(db_path: str = "literature.db"):
                 type TEXT CHECK(type IN ('paper', 'webpage', 'book', 'video', 'blog')) NOT NULL,
                 identifiers TEXT NOT NULL,
                 status TEXT CHECK(status IN ('unread', 'reading', 'completed', 'archived')) DEFAULT 'unread',
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                semantic_scholar_id TEXT GENERATED ALWAYS AS (json_extract(identifiers, '$.semantic_scholar')) STORED,
+                arxiv_id TEXT GENERATED ALWAYS AS (json_extract(identifiers, '$.arxiv')) STORED,
+                doi_id TEXT GENERATED ALWAYS AS (json_extract(identifiers, '$.doi')) STORED,
+                isbn_id TEXT GENERATED ALWAYS AS (json_extract(identifiers, '$.isbn')) STORED,
+                url_id TEXT GENERATED ALWAYS AS (json_extract(identifiers, '$.url')) STORED
             )
         """)
-        
+
         # Create source notes table
         print("Creating source_notes table...")
         cursor.execute("""
@@ -59,7 +68,7 @@ def create_database(db_path: str = "literature.db"):
                 PRIMARY KEY (source_id, note_title)
             )
         """)
-        
+
         # Create entity links table
         print("Creating source_entity_links table...")
         cursor.execute("""
@@ -72,26 +81,145 @@ def create_database(db_path: str = "literature.db"):
                 PRIMARY KEY (source_id, entity_name)
             )
         """)
-        
+
+        conn.commit()
+
+def create_indexes(db_path):
+    """
+    Create all indexes, the full-text search table, and its triggers.
+
+    Run after create_schema (and after any bulk load): indexes built over
+    existing rows come out smaller and less fragmented than indexes
+    maintained insert by insert.
+
+    Args:
+        db_path: Path to the database file
+    """
+    with sqlite3.connect(db_path) as conn:
+        cursor = conn.cursor()
+
         # Create indexes for better performance
         print("Creating indexes...")
         cursor.execute("CREATE INDEX idx_sources_type ON sources(type)")
-        cursor.execute("CREATE INDEX idx_sources_status ON sources(status)")
         cursor.execute("CREATE INDEX idx_sources_created ON sources(created_at)")
+        cursor.execute("CREATE INDEX idx_sources_type_status_created ON sources(type, status, created_at DESC)")
+        cursor.execute("CREATE INDEX idx_sources_status_created ON sources(status, created_at DESC)")
         cursor.execute("CREATE INDEX idx_source_notes_created ON source_notes(created_at)")
         cursor.execute("CREATE INDEX idx_entity_links_name ON source_entity_links(entity_name)")
         cursor.execute("CREATE INDEX idx_entity_links_created ON source_entity_links(created_at)")
-        
+
+        # Partial indexes over the generated identifier columns turn
+        # identifier lookups into B-tree probes instead of json_extract scans
+        for id_column in ('semantic_scholar_id', 'arxiv_id', 'doi_id', 'isbn_id', 'url_id'):
+            cursor.execute(
+                f"CREATE INDEX idx_sources_{id_column} ON sources({id_column}) "
+                f"WHERE {id_column} IS NOT NULL")
+
+        # Create full-text search index over titles
+        print("Creating full-text search index...")
+        cursor.execute("""
+            CREATE VIRTUAL TABLE sources_fts USING fts5(
+                title,
+                content='sources',
+                content_rowid='rowid',
+                tokenize='unicode61'
+            )
+        """)
+
+        # Keep the FTS index in sync with the sources table
+        cursor.execute("""
+            CREATE TRIGGER sources_fts_insert AFTER INSERT ON sources BEGIN
+                INSERT INTO sources_fts(rowid, title) VALUES (new.rowid, new.title);
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER sources_fts_delete AFTER DELETE ON sources BEGIN
+                INSERT INTO sources_fts(sources_fts, rowid, title)
+                VALUES ('delete', old.rowid, old.title);
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER sources_fts_update AFTER UPDATE OF title ON sources BEGIN
+                INSERT INTO sources_fts(sources_fts, rowid, title)
+                VALUES ('delete', old.rowid, old.title);
+                INSERT INTO sources_fts(rowid, title) VALUES (new.rowid, new.title);
+            END
+        """)
+
+        # Index any titles inserted before the triggers existed
+        cursor.execute("INSERT INTO sources_fts(sources_fts) VALUES ('rebuild')")
+
+        conn.commit()
+
+        # Collect statistics over the freshly built indexes so the query
+        # planner starts with accurate row estimates
+        cursor.execute("ANALYZE")
+        cursor.execute("PRAGMA optimize")
+
+def bulk_import(db_path, rows):
+    """
+    Create a new database and load it with sources in one pass.
+
+    The rows go into bare tables and the indexes are built afterwards,
+    which is much faster than inserting into an indexed table.
+
+    Args:
+        db_path: Path for the new database file (must not exist yet)
+        rows: Iterable of (id, title, type, identifiers_json, status) tuples
+
+    Returns:
+        int: Number of sources imported
+    """
+    create_schema(db_path)
+
+    with sqlite3.connect(db_path) as conn:
+        cursor = conn.cursor()
+        cursor.executemany("""
+            INSERT INTO sources (id, title, type, identifiers, status)
+            VALUES (?, ?, ?, ?, ?)
+        """, rows)
+        imported = cursor.rowcount
         conn.commit()
-        print("✅ Database created successfully!")
-        
-        # Show table info
+
+    create_indexes(db_path)
+    return imported
+
+def create_database(db_path: str = "literature.db"):
+    """
+    Create the literature management database with all required tables.
+
+    Args:
+        db_path: Path where to create the database file
+    """
+
+    # Convert to Path object for better handling
+    db_path = Path(db_path)
+
+    # Check if database already exists
+    if db_path.exists():
+        response = input(f"Database {db_path} already exists. Overwrite? (y/N): ")
+        if response.lower() != 'y':
+            print("Setup cancelled.")
+            return
+        db_path.unlink()  # Delete existing database
+
+    print(f"Creating database at: {db_path.absolute()}")
+
+    # Empty database, so schema then indexes back to back
+    create_schema(db_path)
+    create_indexes(db_path)
+
+    print("✅ Database created successfully!")
+
+    # Show table info
+    with sqlite3.connect(db_path) as conn:
+        cursor = conn.cursor()
         cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
         tables = cursor.fetchall()
-        print(f"\nCreated {len(tables)} tables:")
-        for table in tables:
-            print(f"  - {table[0]}")
-    
+    print(f"\nCreated {len(tables)} tables:")
+    for table in tables:
+        print(f"  - {table[0]}")
+
     print(f"\n🎉 Setup complete! Your database is ready at: {db_path.absolute()}")
     print("\nNext steps:")
     print("1. Set the LITERATURE_DB_PATH environment variable:")
@@ -104,20 +232,20 @@ def main():
     """Main setup function with user interaction."""
     print("📚 Literature Manager Database Setup")
     print("=" * 40)
-    
+
     # Get database path from user
     default_path = "literature.db"
     db_path = input(f"Database path (default: {default_path}): ").strip()
     if not db_path:
         db_path = default_path
-    
+
     try:
         create_database(db_path)
     except Exception as e:
         print(f"❌ Error creating database: {e}")
         return 1
-    
+
     return 0
 
 if __name__ == "__main__":
-    exit(main())
\ No newline at end of file
+    exit(main())
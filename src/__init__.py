@@ -5,4 +5,20 @@ A beginner-friendly literature management system using MCP.
 """
 
 __version__ = "1.0.0"
-__author__ = "Literature Manager Team"
\ No newline at end of file
+__author__ = "Literature Manager Team"
+
+# Attributes resolved lazily (PEP 562) so importing the package stays cheap
+_LAZY_ATTRIBUTES = {
+    'LiteratureDatabase': '.database',
+    'DatabaseError': '.database',
+}
+
+def __getattr__(name):
+    """Load heavy submodule attributes on first access."""
+    if name in _LAZY_ATTRIBUTES:
+        from importlib import import_module
+        module = import_module(_LAZY_ATTRIBUTES[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value  # Cache for subsequent lookups
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,19 @@
+"""
+Plain-Data Constants for Literature Manager
+
+This module deliberately imports nothing, so lightweight callers (like the
+CLI validating argument choices) can load it without paying for sqlite3 or
+the rest of the package.
+"""
+
+# Valid source types for literature items
+VALID_SOURCE_TYPES = frozenset({"paper", "webpage", "book", "video", "blog"})
+
+# Valid identifier types for sources
+VALID_IDENTIFIER_TYPES = frozenset({"semantic_scholar", "arxiv", "doi", "isbn", "url"})
+
+# Valid status values for reading progress
+VALID_STATUS_VALUES = frozenset({"unread", "reading", "completed", "archived"})
+
+# Valid relationship types between sources and entities
+VALID_RELATION_TYPES = frozenset({"discusses", "introduces", "extends", "evaluates", "applies", "critiques"})
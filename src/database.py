@@ -4,42 +4,113 @@ Database Operations for Literature Manager
 This module handles all database interactions in a beginner-friendly way.
 """
 
+import os
 import sqlite3
 import json
-import uuid
+import threading
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 from contextlib import contextmanager
+from functools import partial
 
 from .models import (
-    validate_source_type, validate_identifier_type, 
-    validate_status, validate_relation_type
+    validate_source_type, validate_identifier_type, validate_status,
+    VALID_SOURCE_TYPES, VALID_IDENTIFIER_TYPES, VALID_RELATION_TYPES
 )
 
 class DatabaseError(Exception):
     """Custom exception for database-related errors."""
     pass
 
-@contextmanager
-def get_db_connection(db_path: Path):
-    """
-    Context manager for database connections.
-    
-    Args:
-        db_path: Path to the SQLite database file
-        
-    Yields:
-        sqlite3.Connection: Database connection with row factory
+# Generated columns (newer schemas) that make identifier lookups indexable.
+# These were chosen over a normalized source_identifiers child table: they
+# give the same indexed, JSON-free lookup without migrating deployed
+# databases or changing the identifiers payload every client already reads.
+_IDENTIFIER_COLUMNS = {
+    'semantic_scholar': 'semantic_scholar_id',
+    'arxiv': 'arxiv_id',
+    'doi': 'doi_id',
+    'isbn': 'isbn_id',
+    'url': 'url_id',
+}
+
+# Hot-path SQL hoisted to module constants: sqlite3's per-connection
+# statement cache keys on the SQL text, so reusing the same string
+# objects makes cache hits deterministic instead of depending on
+# identical literals being re-created per call
+SQL_INSERT_SOURCE = """
+    INSERT INTO sources (id, title, type, identifiers)
+    VALUES (?, ?, ?, ?)
+"""
+
+SQL_INSERT_NOTE = """
+    INSERT INTO source_notes (source_id, note_title, content)
+    VALUES (?, ?, ?)
+"""
+
+# Existence check folded into the insert: inserts nothing when the
+# source is missing, does nothing on a duplicate title, and the caller
+# branches on rowcount — one statement on the success path
+SQL_INSERT_NOTE_IF_SOURCE = """
+    INSERT INTO source_notes (source_id, note_title, content)
+    SELECT ?, ?, ?
+    WHERE EXISTS (SELECT 1 FROM sources WHERE id = ?)
+    ON CONFLICT(source_id, note_title) DO NOTHING
+"""
+
+SQL_UPDATE_STATUS = "UPDATE sources SET status = ? WHERE id = ?"
+
+SQL_INSERT_LINK = """
+    INSERT INTO source_entity_links
+    (source_id, entity_name, relation_type, notes)
+    VALUES (?, ?, ?, ?)
+"""
+
+SQL_INSERT_LINK_IF_SOURCE = """
+    INSERT INTO source_entity_links
+    (source_id, entity_name, relation_type, notes)
+    SELECT ?, ?, ?, ?
+    WHERE EXISTS (SELECT 1 FROM sources WHERE id = ?)
+    ON CONFLICT(source_id, entity_name) DO NOTHING
+"""
+
+# One prebuilt lookup statement per generated identifier column
+_SQL_FIND_BY_COLUMN = {
+    identifier_type: (
+        "SELECT id, title, type, identifiers, status FROM sources "
+        f"WHERE type = ? AND {id_column} = ?")
+    for identifier_type, id_column in _IDENTIFIER_COLUMNS.items()
+}
+
+SQL_FIND_BY_IDENTIFIER_JSON = """
+    SELECT id, title, type, identifiers, status
+    FROM sources
+    WHERE type = ? AND json_extract(identifiers, ?) = ?
+"""
+
+# Compact encoder for the identifiers column: no whitespace to write,
+# store, or re-parse on every read of the row
+_dump_identifiers = partial(json.dumps, separators=(',', ':'),
+                            ensure_ascii=False)
+
+# Upper bound for the per-instance identifier-lookup cache; keeps
+# read-heavy server sessions from growing one entry per source
+_IDENTIFIER_CACHE_MAX = 256
+
+def _new_uuid() -> str:
+    """Return a random version-4 UUID as a 32-character hex string.
+
+    Equivalent to uuid.uuid4().hex but skips the UUID object: the raw
+    random bytes get the version/variant bits set and are hex-encoded
+    directly, which is noticeably cheaper in bulk-insert loops. The
+    undashed form keeps primary keys four bytes shorter than the
+    canonical rendering, so more keys fit per B-tree page; existing
+    36-character dashed ids remain valid TEXT keys alongside them.
     """
-    if not db_path.exists():
-        raise DatabaseError(f"Database not found at: {db_path}")
-    
-    conn = sqlite3.connect(str(db_path))
-    conn.row_factory = sqlite3.Row  # Enable column access by name
-    try:
-        yield conn
-    finally:
-        conn.close()
+    b = bytearray(os.urandom(16))
+    b[6] = (b[6] & 0x0F) | 0x40
+    b[8] = (b[8] & 0x3F) | 0x80
+    return b.hex()
 
 class LiteratureDatabase:
     """
@@ -55,10 +126,146 @@ class LiteratureDatabase:
         Args:
             db_path: Path to the SQLite database file
         """
-        self.db_path = Path(db_path)
-        if not self.db_path.exists():
+        # A db_path that is already a SQLite URI (e.g. an in-memory
+        # shared-cache database in tests) is used verbatim; plain paths
+        # get the usual rw-mode file URI
+        if str(db_path).startswith('file:'):
+            self.db_path = str(db_path)
+            db_uri = self.db_path
+        else:
+            self.db_path = Path(db_path)
+            db_uri = f"file:{self.db_path}?mode=rw"
+
+        # One long-lived connection shared by every call, so the page
+        # cache and prepared-statement cache survive between operations.
+        # rw (not rwc) mode makes SQLite refuse to open a missing file.
+        try:
+            self._conn = sqlite3.connect(
+                db_uri, uri=True,
+                check_same_thread=False, cached_statements=256)
+        except sqlite3.OperationalError:
             raise DatabaseError(f"Database not found at: {db_path}")
-    
+
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute("PRAGMA cache_size=-65536")       # 64 MiB page cache
+        self._conn.execute("PRAGMA mmap_size=268435456")     # read pages via mmap
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        # Wait briefly on a locked database instead of failing, so
+        # concurrent WAL readers/writers (server threads, parallel
+        # scripts) degrade gracefully
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        # Recommended open-time form: caps the work later "PRAGMA optimize"
+        # calls may do and lets SQLite note which tables need fresh stats
+        self._conn.execute("PRAGMA optimize=0x10002")
+
+        # In-memory cache for identifier lookups, invalidated on writes.
+        # Bounded LRU: hits are re-inserted at the end and the oldest
+        # entry is evicted once _IDENTIFIER_CACHE_MAX is reached.
+        self._identifier_cache = {}
+
+        # Serializes access to the shared connection across threads.
+        # Reentrant so calls inside a transaction() block can re-acquire.
+        self._lock = threading.RLock()
+
+        # True while a transaction() block owns the commit
+        self._in_txn = False
+
+    def close(self):
+        """Close the underlying database connection.
+
+        Runs PRAGMA optimize first so SQLite refreshes stale table
+        statistics on clean shutdown, keeping query plans good as the
+        database grows.
+        """
+        try:
+            self._conn.execute("PRAGMA optimize")
+        except sqlite3.Error:
+            pass  # Optimization is best-effort; never block shutdown
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    @contextmanager
+    def _connection(self):
+        """Yield the shared long-lived connection, holding the lock."""
+        with self._lock:
+            yield self._conn
+
+    def _commit(self, conn):
+        """Commit now, unless a surrounding transaction() owns the commit."""
+        if not self._in_txn:
+            conn.commit()
+
+    def _rollback(self, conn):
+        """Undo a failed statement's implicit transaction.
+
+        The persistent connection would otherwise carry the open
+        transaction into later calls, where transaction() fails with
+        'cannot start a transaction within a transaction' and unrelated
+        writes get silently grouped together. Inside a transaction()
+        block the rollback handler there owns the cleanup.
+        """
+        if not self._in_txn:
+            conn.rollback()
+
+    @contextmanager
+    def _batch(self, conn):
+        """Run a batch of statements as one committed unit.
+
+        Inside a transaction() block the caller owns the commit, so the
+        statements simply join the open transaction; otherwise the batch
+        gets its own commit (and rollback on error) via the connection's
+        context manager.
+        """
+        if self._in_txn:
+            yield
+        else:
+            with conn:
+                yield
+
+    @contextmanager
+    def transaction(self):
+        """
+        Group several write calls into a single transaction.
+
+        Every add_source/add_note/update_status/link_to_entity call inside
+        the block shares one commit (one disk sync), which makes loops of
+        per-row writes behave like a batch insert:
+
+            with db.transaction():
+                for entry in entries:
+                    db.add_source(...)
+
+        Raises:
+            DatabaseError: If a transaction is already open
+        """
+        with self._lock:
+            if self._in_txn:
+                raise DatabaseError("A transaction is already in progress")
+
+            self._in_txn = True
+            try:
+                self._conn.execute("BEGIN IMMEDIATE")
+                yield
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                # Lookups made inside the block may have cached rows
+                # that the rollback just removed
+                self._identifier_cache.clear()
+                raise
+            finally:
+                self._in_txn = False
+
+
     def add_source(self, title: str, source_type: str, identifier_type: str, 
                    identifier_value: str) -> str:
         """
@@ -76,9 +283,9 @@ class LiteratureDatabase:
         Raises:
             DatabaseError: If validation fails or database error occurs
         """
-        # Validate inputs
-        if not validate_source_type(source_type):
-            raise DatabaseError(f"Invalid source type: {source_type}")
+        # The schema CHECK is the authoritative source-type validator;
+        # identifier_type still needs a Python check because the JSON
+        # identifiers column carries no constraint for it
         if not validate_identifier_type(identifier_type):
             raise DatabaseError(f"Invalid identifier type: {identifier_type}")
         
@@ -88,22 +295,221 @@ class LiteratureDatabase:
             raise DatabaseError(f"Source already exists with ID: {existing['id']}")
         
         # Create new source
-        source_id = str(uuid.uuid4())
+        source_id = _new_uuid()
         identifiers = {identifier_type: identifier_value}
         
-        with get_db_connection(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.cursor()
             try:
-                cursor.execute("""
-                    INSERT INTO sources (id, title, type, identifiers)
-                    VALUES (?, ?, ?, ?)
-                """, [source_id, title, source_type, json.dumps(identifiers)])
-                conn.commit()
+                cursor.execute(SQL_INSERT_SOURCE,
+                               [source_id, title, source_type, _dump_identifiers(identifiers)])
+                self._commit(conn)
+                self._identifier_cache.clear()
                 return source_id
+            except sqlite3.IntegrityError as e:
+                self._rollback(conn)
+                if "CHECK" in str(e):
+                    raise DatabaseError(f"Invalid source type: {source_type}")
+                raise DatabaseError(f"Failed to add source: {e}")
             except sqlite3.Error as e:
+                self._rollback(conn)
                 raise DatabaseError(f"Failed to add source: {e}")
     
-    def find_source_by_identifier(self, identifier_type: str, identifier_value: str, 
+    @staticmethod
+    def _check_invalid(label: str, values: set, valid: frozenset):
+        """Raise DatabaseError listing every value not in the valid set."""
+        invalid = values - valid
+        if invalid:
+            raise DatabaseError(
+                f"Invalid {label}: {', '.join(sorted(invalid))}")
+
+    def bulk_import(self, sources: List[Dict[str, Any]]) -> List[str]:
+        """
+        Import many sources (with notes and entity links) in one transaction.
+
+        Rows for all three tables are flattened first, then inserted with
+        three executemany() calls inside a single transaction, so the
+        statements are prepared once and the whole import needs one commit.
+
+        Args:
+            sources: List of dicts, each with title, source_type,
+                identifier_type, identifier_value, plus optional
+                'notes' [(title, content), ...] and
+                'entities' [(name, relation_type[, notes]), ...]
+
+        Returns:
+            List of UUIDs for the created sources
+
+        Raises:
+            DatabaseError: If validation fails or database error occurs
+        """
+        # Validate whole columns with set differences instead of one
+        # validator call per row
+        self._check_invalid("source type",
+                            {entry['source_type'] for entry in sources},
+                            VALID_SOURCE_TYPES)
+        self._check_invalid("identifier type",
+                            {entry['identifier_type'] for entry in sources},
+                            VALID_IDENTIFIER_TYPES)
+        self._check_invalid("relation type",
+                            {link[1] for entry in sources
+                             for link in entry.get('entities', [])},
+                            VALID_RELATION_TYPES)
+
+        source_rows = []
+        note_rows = []
+        link_rows = []
+        created_ids = []
+
+        for entry in sources:
+            source_id = _new_uuid()
+            created_ids.append(source_id)
+            identifiers = {entry['identifier_type']: entry['identifier_value']}
+            source_rows.append([source_id, entry['title'], entry['source_type'],
+                                _dump_identifiers(identifiers)])
+
+            for note_title, content in entry.get('notes', []):
+                note_rows.append([source_id, note_title, content])
+
+            for link in entry.get('entities', []):
+                link_notes = link[2] if len(link) > 2 else None
+                link_rows.append([source_id, link[0], link[1], link_notes])
+
+        with self._connection() as conn:
+            try:
+                with self._batch(conn):  # Single transaction for the whole import
+                    conn.executemany("""
+                        INSERT INTO sources (id, title, type, identifiers)
+                        VALUES (?, ?, ?, ?)
+                    """, source_rows)
+                    if note_rows:
+                        conn.executemany("""
+                            INSERT INTO source_notes (source_id, note_title, content)
+                            VALUES (?, ?, ?)
+                        """, note_rows)
+                    if link_rows:
+                        conn.executemany("""
+                            INSERT INTO source_entity_links
+                            (source_id, entity_name, relation_type, notes)
+                            VALUES (?, ?, ?, ?)
+                        """, link_rows)
+            except sqlite3.Error as e:
+                raise DatabaseError(f"Bulk import failed: {e}")
+
+            # Refresh planner statistics after a large ingest (deferred
+            # to the owner's commit when inside a transaction() block)
+            if not self._in_txn:
+                conn.execute("PRAGMA optimize")
+
+        self._identifier_cache.clear()
+        return created_ids
+
+    def add_sources_bulk(self, items: List[Tuple[str, str, str, str]]) -> List[str]:
+        """
+        Add many sources with one prepared statement and one commit.
+
+        Args:
+            items: List of (title, source_type, identifier_type,
+                identifier_value) tuples
+
+        Returns:
+            List of UUIDs for the created sources, in input order
+
+        Raises:
+            DatabaseError: If validation fails or a database error occurs
+        """
+        self._check_invalid("source type",
+                            {item[1] for item in items}, VALID_SOURCE_TYPES)
+        self._check_invalid("identifier type",
+                            {item[2] for item in items}, VALID_IDENTIFIER_TYPES)
+
+        rows = []
+        created_ids = []
+        for title, source_type, identifier_type, identifier_value in items:
+            source_id = _new_uuid()
+            created_ids.append(source_id)
+            rows.append([source_id, title, source_type,
+                         _dump_identifiers({identifier_type: identifier_value})])
+
+        if not rows:
+            return []
+
+        with self._connection() as conn:
+            try:
+                with self._batch(conn):
+                    conn.executemany("""
+                        INSERT INTO sources (id, title, type, identifiers)
+                        VALUES (?, ?, ?, ?)
+                    """, rows)
+            except sqlite3.Error as e:
+                raise DatabaseError(f"Failed to add sources: {e}")
+
+        self._identifier_cache.clear()
+        return created_ids
+
+    def add_notes_bulk(self, notes: List[Tuple[str, str, str]]) -> int:
+        """
+        Add many notes with one prepared statement and one commit.
+
+        Args:
+            notes: List of (source_id, note_title, content) tuples
+
+        Returns:
+            int: Number of notes inserted
+
+        Raises:
+            DatabaseError: If a database error occurs
+        """
+        if not notes:
+            return 0
+
+        with self._connection() as conn:
+            try:
+                with self._batch(conn):
+                    conn.executemany("""
+                        INSERT INTO source_notes (source_id, note_title, content)
+                        VALUES (?, ?, ?)
+                    """, notes)
+            except sqlite3.Error as e:
+                raise DatabaseError(f"Failed to add notes: {e}")
+
+        self._identifier_cache.clear()
+        return len(notes)
+
+    def link_to_entities_bulk(self, links: List[Tuple[str, str, str, Optional[str]]]) -> int:
+        """
+        Create many entity links with one prepared statement and one commit.
+
+        Args:
+            links: List of (source_id, entity_name, relation_type, notes) tuples
+
+        Returns:
+            int: Number of links created
+
+        Raises:
+            DatabaseError: If validation fails or a database error occurs
+        """
+        if not links:
+            return 0
+
+        self._check_invalid("relation type",
+                            {link[2] for link in links}, VALID_RELATION_TYPES)
+
+        with self._connection() as conn:
+            try:
+                with self._batch(conn):
+                    conn.executemany("""
+                        INSERT INTO source_entity_links
+                        (source_id, entity_name, relation_type, notes)
+                        VALUES (?, ?, ?, ?)
+                    """, links)
+            except sqlite3.Error as e:
+                raise DatabaseError(f"Failed to create entity links: {e}")
+
+        self._identifier_cache.clear()
+        return len(links)
+
+    def find_source_by_identifier(self, identifier_type: str, identifier_value: str,
                                   source_type: str) -> Optional[Dict[str, Any]]:
         """
         Find a source by its identifier.
@@ -116,25 +522,119 @@ class LiteratureDatabase:
         Returns:
             Dict with source info if found, None otherwise
         """
-        with get_db_connection(self.db_path) as conn:
+        cache_key = (identifier_type, identifier_value, source_type)
+        cached = self._identifier_cache.pop(cache_key, None)
+        if cached is not None:
+            # Re-insert on hit so the entry moves to the young end
+            self._identifier_cache[cache_key] = cached
+            return cached
+
+        with self._connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT id, title, type, identifiers, status
-                FROM sources
-                WHERE type = ? AND json_extract(identifiers, ?) = ?
-            """, [source_type, f"$.{identifier_type}", identifier_value])
-            
+            try:
+                # Indexed probe over the generated identifier column
+                cursor.execute(_SQL_FIND_BY_COLUMN[identifier_type],
+                               [source_type, identifier_value])
+            except (KeyError, sqlite3.OperationalError):
+                # Databases created before the generated columns existed
+                cursor.execute(SQL_FIND_BY_IDENTIFIER_JSON,
+                               [source_type, f"$.{identifier_type}", identifier_value])
+
             row = cursor.fetchone()
             if row:
-                return {
+                source = {
                     'id': row['id'],
                     'title': row['title'],
                     'type': row['type'],
                     'identifiers': json.loads(row['identifiers']),
                     'status': row['status']
                 }
+                if len(self._identifier_cache) >= _IDENTIFIER_CACHE_MAX:
+                    # Evict the least recently used entry (dicts keep
+                    # insertion order, so the first key is the oldest)
+                    del self._identifier_cache[
+                        next(iter(self._identifier_cache))]
+                self._identifier_cache[cache_key] = source
+                return source
             return None
     
+    # Selects a source row plus its notes and entity links as JSON arrays,
+    # so a complete source payload is one round-trip instead of three
+    _FULL_SOURCE_SELECT = """
+        SELECT s.id, s.title, s.type, s.identifiers, s.status, s.created_at,
+               (SELECT json_group_array(json_object(
+                        'title', note_title,
+                        'content', content,
+                        'created_at', created_at))
+                FROM (SELECT note_title, content, created_at
+                      FROM source_notes
+                      WHERE source_id = s.id
+                      ORDER BY created_at DESC)) AS notes_json,
+               (SELECT json_group_array(json_object(
+                        'entity_name', entity_name,
+                        'relation_type', relation_type,
+                        'notes', notes,
+                        'created_at', created_at))
+                FROM source_entity_links
+                WHERE source_id = s.id) AS links_json,
+               (SELECT group_concat(je.key || ': ' || je.value, ', ')
+                FROM json_each(s.identifiers) je) AS identifiers_text
+        FROM sources s
+    """
+
+    @staticmethod
+    def _row_to_full_source(row) -> Dict[str, Any]:
+        """Convert a _FULL_SOURCE_SELECT row into a source dictionary."""
+        return {
+            'id': row['id'],
+            'title': row['title'],
+            'type': row['type'],
+            'identifiers': json.loads(row['identifiers']),
+            'status': row['status'],
+            'created_at': row['created_at'],
+            'identifiers_text': row['identifiers_text'],
+            'notes': json.loads(row['notes_json'] or '[]'),
+            'entity_links': json.loads(row['links_json'] or '[]')
+        }
+
+    def find_full_source_by_identifier(self, identifier_type: str, identifier_value: str,
+                                       source_type: str) -> Optional[Dict[str, Any]]:
+        """
+        Find a source by its identifier and return complete details.
+
+        This folds find_source_by_identifier + get_source_by_id into a
+        single query, avoiding a second round-trip.
+
+        Args:
+            identifier_type: Type of identifier
+            identifier_value: Value of the identifier
+            source_type: Type of source
+
+        Returns:
+            Dict with complete source info including notes and entity links,
+            None if not found
+        """
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            id_column = _IDENTIFIER_COLUMNS.get(identifier_type)
+            try:
+                cursor.execute(
+                    self._FULL_SOURCE_SELECT + f"WHERE s.type = ? AND s.{id_column} = ?",
+                    [source_type, identifier_value])
+            except sqlite3.OperationalError:
+                cursor.execute(
+                    self._FULL_SOURCE_SELECT + "WHERE s.type = ? AND json_extract(s.identifiers, ?) = ?",
+                    [source_type, f"$.{identifier_type}", identifier_value])
+
+            row = cursor.fetchone()
+            return self._row_to_full_source(row) if row else None
+
+    def _get_full_source(self, cursor, source_id: str) -> Optional[Dict[str, Any]]:
+        """Load a complete source dict (notes and links included) on an open cursor."""
+        cursor.execute(self._FULL_SOURCE_SELECT + "WHERE s.id = ?", [source_id])
+        row = cursor.fetchone()
+        return self._row_to_full_source(row) if row else None
+
     def get_source_by_id(self, source_id: str) -> Optional[Dict[str, Any]]:
         """
         Get complete source information by ID.
@@ -145,65 +645,117 @@ class LiteratureDatabase:
         Returns:
             Dict with complete source info including notes and entity links
         """
-        with get_db_connection(self.db_path) as conn:
+        with self._connection() as conn:
+            return self._get_full_source(conn.cursor(), source_id)
+    
+    def iter_sources_full(self):
+        """
+        Stream complete source dicts (notes and links included) lazily.
+
+        Runs the combined source/notes/links query once instead of a point
+        lookup per source, so walking the whole library is a single
+        statement rather than the N+1 pattern of list_sources followed by
+        get_source_by_id per row.
+
+        Yields:
+            Dict with complete source info, newest first
+        """
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(self._FULL_SOURCE_SELECT + "ORDER BY s.created_at DESC")
+            for row in cursor:
+                yield self._row_to_full_source(row)
+
+    def count_by(self, column: str) -> Dict[str, int]:
+        """
+        Count sources grouped by a column, aggregated in SQL.
+
+        Args:
+            column: Column to group by ('type' or 'status')
+
+        Returns:
+            Dict mapping column value to source count
+
+        Raises:
+            DatabaseError: If the column is not groupable
+        """
+        if column not in ('type', 'status'):
+            raise DatabaseError(f"Cannot count by column: {column}")
+
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"SELECT {column}, COUNT(*) as count FROM sources GROUP BY {column}")
+            return {row[column]: row['count'] for row in cursor}
+
+    def most_connected_entities(self, limit: int = 5) -> List[Tuple[str, int]]:
+        """
+        Get the entities linked to the most sources, aggregated in SQL.
+
+        Args:
+            limit: Maximum number of entities
+
+        Returns:
+            List of (entity_name, connection_count) tuples, most first
+        """
+        with self._connection() as conn:
             cursor = conn.cursor()
-            
-            # Get basic source info
             cursor.execute("""
-                SELECT id, title, type, identifiers, status, created_at
-                FROM sources WHERE id = ?
-            """, [source_id])
-            
-            source_row = cursor.fetchone()
-            if not source_row:
-                return None
-            
-            source = {
-                'id': source_row['id'],
-                'title': source_row['title'],
-                'type': source_row['type'],
-                'identifiers': json.loads(source_row['identifiers']),
-                'status': source_row['status'],
-                'created_at': source_row['created_at']
-            }
-            
-            # Get notes
+                SELECT entity_name, COUNT(*) as count
+                FROM source_entity_links
+                GROUP BY entity_name
+                ORDER BY count DESC, entity_name
+                LIMIT ?
+            """, [limit])
+            return [(row['entity_name'], row['count']) for row in cursor]
+
+    def top_sources_by_note_count(self, limit: int = 3) -> List[Tuple[str, int]]:
+        """
+        Get the sources with the most notes, counted in SQL.
+
+        Args:
+            limit: Maximum number of sources
+
+        Returns:
+            List of (title, note_count) tuples, most notes first
+        """
+        with self._connection() as conn:
+            cursor = conn.cursor()
             cursor.execute("""
-                SELECT note_title, content, created_at
-                FROM source_notes
-                WHERE source_id = ?
-                ORDER BY created_at DESC
-            """, [source_id])
-            
-            source['notes'] = [
-                {
-                    'title': row['note_title'],
-                    'content': row['content'],
-                    'created_at': row['created_at']
-                }
-                for row in cursor.fetchall()
-            ]
-            
-            # Get entity links
+                SELECT s.title, COUNT(n.note_title) as note_count
+                FROM sources s
+                JOIN source_notes n ON n.source_id = s.id
+                GROUP BY s.id
+                ORDER BY note_count DESC, s.title
+                LIMIT ?
+            """, [limit])
+            return [(row['title'], row['note_count']) for row in cursor]
+
+    def sources_linked_to_entity(self, entity_name: str) -> List[Dict[str, Any]]:
+        """
+        Get the sources linked to an entity with one indexed JOIN.
+
+        Args:
+            entity_name: Name of the entity
+
+        Returns:
+            List of dicts with title and relation_type
+        """
+        with self._connection() as conn:
+            cursor = conn.cursor()
             cursor.execute("""
-                SELECT entity_name, relation_type, notes, created_at
-                FROM source_entity_links
-                WHERE source_id = ?
-            """, [source_id])
-            
-            source['entity_links'] = [
-                {
-                    'entity_name': row['entity_name'],
-                    'relation_type': row['relation_type'],
-                    'notes': row['notes'],
-                    'created_at': row['created_at']
-                }
-                for row in cursor.fetchall()
+                SELECT s.title, l.relation_type
+                FROM source_entity_links l
+                JOIN sources s ON s.id = l.source_id
+                WHERE l.entity_name = ?
+                ORDER BY s.created_at DESC
+            """, [entity_name])
+            return [
+                {'title': row['title'], 'relation_type': row['relation_type']}
+                for row in cursor
             ]
-            
-            return source
-    
-    def add_note(self, source_id: str, note_title: str, content: str) -> bool:
+
+    def add_note(self, source_id: str, note_title: str,
+                 content: str) -> Optional[Dict[str, Any]]:
         """
         Add a note to a source.
         
@@ -213,39 +765,35 @@ class LiteratureDatabase:
             content: Content of the note
             
         Returns:
-            bool: True if successful
+            Dict with the updated source (notes and links included)
             
         Raises:
             DatabaseError: If source not found or database error
         """
-        with get_db_connection(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.cursor()
-            
-            # Check if source exists
-            cursor.execute("SELECT id FROM sources WHERE id = ?", [source_id])
-            if not cursor.fetchone():
-                raise DatabaseError(f"Source not found: {source_id}")
-            
-            # Check if note title already exists
-            cursor.execute("""
-                SELECT 1 FROM source_notes 
-                WHERE source_id = ? AND note_title = ?
-            """, [source_id, note_title])
-            
-            if cursor.fetchone():
-                raise DatabaseError(f"Note with title '{note_title}' already exists")
-            
             try:
-                cursor.execute("""
-                    INSERT INTO source_notes (source_id, note_title, content)
-                    VALUES (?, ?, ?)
-                """, [source_id, note_title, content])
-                conn.commit()
-                return True
+                cursor.execute(SQL_INSERT_NOTE_IF_SOURCE,
+                               [source_id, note_title, content, source_id])
             except sqlite3.Error as e:
+                self._rollback(conn)
                 raise DatabaseError(f"Failed to add note: {e}")
+
+            if cursor.rowcount == 0:
+                # Only the failure path pays for a second query
+                cursor.execute("SELECT 1 FROM sources WHERE id = ?", [source_id])
+                exists = cursor.fetchone()
+                self._rollback(conn)
+                if not exists:
+                    raise DatabaseError(f"Source not found: {source_id}")
+                raise DatabaseError(f"Note with title '{note_title}' already exists")
+
+            self._commit(conn)
+            self._identifier_cache.clear()
+            return self._get_full_source(cursor, source_id)
     
-    def update_status(self, source_id: str, new_status: str) -> bool:
+    def update_status(self, source_id: str,
+                      new_status: str) -> Optional[Dict[str, Any]]:
         """
         Update the reading status of a source.
         
@@ -254,31 +802,35 @@ class LiteratureDatabase:
             new_status: New status value
             
         Returns:
-            bool: True if successful
+            Dict with the updated source (notes and links included)
             
         Raises:
             DatabaseError: If validation fails or database error
         """
-        if not validate_status(new_status):
-            raise DatabaseError(f"Invalid status: {new_status}")
-        
-        with get_db_connection(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.cursor()
             try:
-                cursor.execute("""
-                    UPDATE sources SET status = ? WHERE id = ?
-                """, [new_status, source_id])
+                cursor.execute(SQL_UPDATE_STATUS, [new_status, source_id])
                 
                 if cursor.rowcount == 0:
+                    self._rollback(conn)
                     raise DatabaseError(f"Source not found: {source_id}")
                 
-                conn.commit()
-                return True
+                self._commit(conn)
+                self._identifier_cache.clear()
+                return self._get_full_source(cursor, source_id)
+            except sqlite3.IntegrityError as e:
+                self._rollback(conn)
+                if "CHECK" in str(e):
+                    raise DatabaseError(f"Invalid status: {new_status}")
+                raise DatabaseError(f"Failed to update status: {e}")
             except sqlite3.Error as e:
+                self._rollback(conn)
                 raise DatabaseError(f"Failed to update status: {e}")
     
-    def link_to_entity(self, source_id: str, entity_name: str, 
-                       relation_type: str, notes: Optional[str] = None) -> bool:
+    def link_to_entity(self, source_id: str, entity_name: str,
+                       relation_type: str,
+                       notes: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         Link a source to an entity.
         
@@ -289,41 +841,36 @@ class LiteratureDatabase:
             notes: Optional notes about the relationship
             
         Returns:
-            bool: True if successful
+            Dict with the updated source (notes and links included)
             
         Raises:
             DatabaseError: If validation fails or database error
         """
-        if not validate_relation_type(relation_type):
-            raise DatabaseError(f"Invalid relation type: {relation_type}")
-        
-        with get_db_connection(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.cursor()
-            
-            # Check if source exists
-            cursor.execute("SELECT id FROM sources WHERE id = ?", [source_id])
-            if not cursor.fetchone():
-                raise DatabaseError(f"Source not found: {source_id}")
-            
-            # Check if link already exists
-            cursor.execute("""
-                SELECT 1 FROM source_entity_links 
-                WHERE source_id = ? AND entity_name = ?
-            """, [source_id, entity_name])
-            
-            if cursor.fetchone():
-                raise DatabaseError(f"Link already exists between source and entity '{entity_name}'")
-            
             try:
-                cursor.execute("""
-                    INSERT INTO source_entity_links 
-                    (source_id, entity_name, relation_type, notes)
-                    VALUES (?, ?, ?, ?)
-                """, [source_id, entity_name, relation_type, notes])
-                conn.commit()
-                return True
+                cursor.execute(SQL_INSERT_LINK_IF_SOURCE,
+                               [source_id, entity_name, relation_type, notes, source_id])
+            except sqlite3.IntegrityError as e:
+                self._rollback(conn)
+                if "CHECK" in str(e):
+                    raise DatabaseError(f"Invalid relation type: {relation_type}")
+                raise DatabaseError(f"Failed to create entity link: {e}")
             except sqlite3.Error as e:
+                self._rollback(conn)
                 raise DatabaseError(f"Failed to create entity link: {e}")
+
+            if cursor.rowcount == 0:
+                cursor.execute("SELECT 1 FROM sources WHERE id = ?", [source_id])
+                exists = cursor.fetchone()
+                self._rollback(conn)
+                if not exists:
+                    raise DatabaseError(f"Source not found: {source_id}")
+                raise DatabaseError(f"Link already exists between source and entity '{entity_name}'")
+
+            self._commit(conn)
+            self._identifier_cache.clear()
+            return self._get_full_source(cursor, source_id)
     
     def list_sources(self, source_type: Optional[str] = None, 
                      status: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
@@ -360,10 +907,138 @@ class LiteratureDatabase:
         query += " ORDER BY created_at DESC LIMIT ?"
         params.append(limit)
         
-        with get_db_connection(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.cursor()
+            # Plain tuples instead of sqlite3.Row: the dicts below are
+            # built positionally, so the Row wrapper per result row and
+            # its name lookups are pure overhead in this loop
+            cursor.row_factory = None
             cursor.execute(query, params)
-            
+
+            return [
+                {
+                    'id': row[0],
+                    'title': row[1],
+                    'type': row[2],
+                    'status': row[3],
+                    'created_at': row[4]
+                }
+                for row in cursor
+            ]
+    
+    def iter_source_headers(self, source_type: Optional[str] = None,
+                            status: Optional[str] = None, limit: int = 20):
+        """
+        Stream lightweight source headers with filtering done fully in SQL.
+
+        Unlike list_sources, this yields only the columns display code
+        actually prints (title, type, status, created_at) straight from the
+        cursor as sqlite3.Row objects: the filter and ordering ride the
+        (type, status, created_at) index, each row fetch skips decoding
+        the identifiers JSON, and peak memory stays constant regardless
+        of limit. (The index is not covering — title still comes from
+        the table row.)
+
+        Args:
+            source_type: Optional filter by source type
+            status: Optional filter by status
+            limit: Maximum number of results
+
+        Yields:
+            sqlite3.Row header rows
+        """
+        query = "SELECT title, type, status, created_at FROM sources"
+        params = []
+        conditions = []
+
+        if source_type:
+            if not validate_source_type(source_type):
+                raise DatabaseError(f"Invalid source type: {source_type}")
+            conditions.append("type = ?")
+            params.append(source_type)
+
+        if status:
+            if not validate_status(status):
+                raise DatabaseError(f"Invalid status: {status}")
+            conditions.append("status = ?")
+            params.append(status)
+
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+
+        query += " ORDER BY created_at DESC LIMIT ?"
+        params.append(limit)
+
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            yield from cursor
+
+    def list_source_headers(self, source_type: Optional[str] = None,
+                            status: Optional[str] = None, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        List lightweight source headers (materialized iter_source_headers).
+
+        Args:
+            source_type: Optional filter by source type
+            status: Optional filter by status
+            limit: Maximum number of results
+
+        Returns:
+            List of header dictionaries
+        """
+        return [
+            {
+                'title': row['title'],
+                'type': row['type'],
+                'status': row['status'],
+                'created_at': row['created_at']
+            }
+            for row in self.iter_source_headers(source_type, status, limit)
+        ]
+
+    @staticmethod
+    def _fts_prefix_query(query: str) -> str:
+        """Turn a user query into a quoted FTS5 prefix query."""
+        tokens = [token.replace('"', '""') for token in query.split()]
+        return ' '.join(f'"{token}"*' for token in tokens)
+
+    def search_by_title(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Search sources by title using the FTS5 index.
+
+        Args:
+            query: Search query (matched as word prefixes)
+            limit: Maximum number of results
+
+        Returns:
+            List of source dictionaries, best matches first
+        """
+        fts_query = self._fts_prefix_query(query)
+        if not fts_query:
+            return []
+
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("""
+                    SELECT s.id, s.title, s.type, s.status, s.created_at
+                    FROM sources_fts f
+                    JOIN sources s ON s.rowid = f.rowid
+                    WHERE sources_fts MATCH ?
+                    ORDER BY rank
+                    LIMIT ?
+                """, [fts_query, limit])
+            except sqlite3.OperationalError:
+                # Databases created before the FTS index existed
+                cursor.execute("""
+                    SELECT id, title, type, status, created_at
+                    FROM sources
+                    WHERE title LIKE ?
+                    ORDER BY created_at DESC
+                    LIMIT ?
+                """, [f"%{query}%", limit])
+
             return [
                 {
                     'id': row['id'],
@@ -372,9 +1047,9 @@ class LiteratureDatabase:
                     'status': row['status'],
                     'created_at': row['created_at']
                 }
-                for row in cursor.fetchall()
+                for row in cursor
             ]
-    
+
     def get_database_stats(self) -> Dict[str, Any]:
         """
         Get database statistics.
@@ -382,35 +1057,37 @@ class LiteratureDatabase:
         Returns:
             Dict with database statistics
         """
-        with get_db_connection(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.cursor()
-            
+
             stats = {}
-            
-            # Count sources by type
+
+            # One pass over sources yields total plus both breakdowns
             cursor.execute("""
-                SELECT type, COUNT(*) as count 
-                FROM sources 
-                GROUP BY type
+                SELECT type, status, COUNT(*) as count
+                FROM sources
+                GROUP BY type, status
             """)
-            stats['sources_by_type'] = {row['type']: row['count'] for row in cursor.fetchall()}
-            
-            # Count sources by status
+
+            sources_by_type = {}
+            sources_by_status = {}
+            total_sources = 0
+            for row in cursor:
+                sources_by_type[row['type']] = sources_by_type.get(row['type'], 0) + row['count']
+                sources_by_status[row['status']] = sources_by_status.get(row['status'], 0) + row['count']
+                total_sources += row['count']
+
+            stats['sources_by_type'] = sources_by_type
+            stats['sources_by_status'] = sources_by_status
+            stats['total_sources'] = total_sources
+
+            # Remaining totals as scalar subqueries in a single row
             cursor.execute("""
-                SELECT status, COUNT(*) as count 
-                FROM sources 
-                GROUP BY status
+                SELECT (SELECT COUNT(*) FROM source_notes) AS total_notes,
+                       (SELECT COUNT(*) FROM source_entity_links) AS total_entity_links
             """)
-            stats['sources_by_status'] = {row['status']: row['count'] for row in cursor.fetchall()}
-            
-            # Total counts
-            cursor.execute("SELECT COUNT(*) as count FROM sources")
-            stats['total_sources'] = cursor.fetchone()['count']
-            
-            cursor.execute("SELECT COUNT(*) as count FROM source_notes")
-            stats['total_notes'] = cursor.fetchone()['count']
-            
-            cursor.execute("SELECT COUNT(*) as count FROM source_entity_links")
-            stats['total_entity_links'] = cursor.fetchone()['count']
-            
+            row = cursor.fetchone()
+            stats['total_notes'] = row['total_notes']
+            stats['total_entity_links'] = row['total_entity_links']
+
             return stats
\ No newline at end of file
@@ -5,28 +5,136 @@ This module defines all the tools available through the MCP interface.
 Each tool is designed to be beginner-friendly with clear documentation.
 """
 
+import functools
 import os
-from pathlib import Path
+import threading
+import time
 from typing import List, Dict, Any, Optional
-from fastmcp import FastMCP
 
 from .database import LiteratureDatabase, DatabaseError
-from .models import VALID_SOURCE_TYPES, VALID_IDENTIFIER_TYPES, VALID_STATUS_VALUES, VALID_RELATION_TYPES
-from .utils import format_source_summary, validate_input_data, search_sources_by_title
+from .models import (
+    VALID_SOURCE_TYPES, VALID_IDENTIFIER_TYPES, VALID_STATUS_VALUES, VALID_RELATION_TYPES,
+    VALID_SOURCE_TYPES_STR, VALID_STATUS_VALUES_STR, VALID_RELATION_TYPES_STR,
+    TYPE_DISPLAY, STATUS_DISPLAY
+)
+from .utils import format_source_summary, validate_input_data
 
-# Initialize FastMCP server
-mcp = FastMCP("Literature Manager")
+# The FastMCP server is built lazily: importing fastmcp pulls in several
+# seconds of transitive dependencies, which scripts and tests that only
+# call the tool functions directly never need. Tools queue up here and
+# are registered when the server is first requested.
+_TOOLS = []
+_mcp = None
 
-# Get database path from environment
-DB_PATH = os.environ.get('LITERATURE_DB_PATH')
-if not DB_PATH:
-    raise ValueError("LITERATURE_DB_PATH environment variable must be set")
+def _tool(fn):
+    """Queue a function for registration as an MCP tool."""
+    _TOOLS.append(fn)
+    return fn
+
+def _tool_result(fn):
+    """Translate exceptions into the standard error payload.
+
+    Every tool returns {'success': False, 'error': ...} on failure;
+    wrapping the bodies once here replaces the identical try/except
+    block each tool used to carry.
+    """
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        try:
+            return fn(*args, **kwargs)
+        except DatabaseError as e:
+            return {
+                'success': False,
+                'error': str(e)
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'error': f'Unexpected error: {str(e)}'
+            }
+    return wrapper
+
+def _get_mcp():
+    """Build the FastMCP server on first use and register all tools."""
+    global _mcp
+    if _mcp is None:
+        from fastmcp import FastMCP
+        _mcp = FastMCP("Literature Manager")
+        for fn in _TOOLS:
+            _mcp.tool()(fn)
+    return _mcp
+
+def __getattr__(name):
+    # Keep "from src.tools import mcp" working without importing
+    # fastmcp at module-import time
+    if name == 'mcp':
+        return _get_mcp()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Database path, resolved from the environment on first use rather than
+# at import time, so importing this module never fails or reads env vars
+_DB_PATH: Optional[str] = None
+
+def set_db_path(db_path) -> None:
+    """Point the tools at a database path (overrides the environment)."""
+    global _DB_PATH
+    with _DB_LOCK:
+        _DB_PATH = str(db_path)
+
+def _resolve_db_path() -> str:
+    """Return the configured database path, reading the env var once."""
+    global _DB_PATH
+    if _DB_PATH is None:
+        db_path = os.environ.get('LITERATURE_DB_PATH')
+        if not db_path:
+            raise ValueError("LITERATURE_DB_PATH environment variable must be set")
+        _DB_PATH = db_path
+    return _DB_PATH
+
+# Cache of LiteratureDatabase instances keyed by path, so every tool
+# call after the first reuses one connection (page cache, prepared
+# statements, PRAGMAs) instead of reopening the database
+_DB_CACHE: Dict[str, LiteratureDatabase] = {}
+_DB_LOCK = threading.Lock()
+_CACHE_STATS = {'hits': 0, 'misses': 0}
+
+# Stats answers rarely change between consecutive calls; cache the last
+# result briefly so dashboards polling database_stats cost one query
+# per window instead of one per call. Identifier lookups are already
+# cached (with write invalidation) inside LiteratureDatabase itself.
+_STATS_TTL_SECONDS = 5.0
+_STATS_CACHE = {'at': 0.0, 'stats': None, 'summary': None}
+_STATS_LOCK = threading.Lock()
 
 def get_database() -> LiteratureDatabase:
-    """Get database instance."""
-    return LiteratureDatabase(DB_PATH)
+    """Get the shared database instance, creating it on first use."""
+    with _DB_LOCK:
+        db_path = _resolve_db_path()
+        db = _DB_CACHE.get(db_path)
+        if db is None:
+            _CACHE_STATS['misses'] += 1
+            db = LiteratureDatabase(db_path)
+            _DB_CACHE[db_path] = db
+        else:
+            _CACHE_STATS['hits'] += 1
+        return db
+
+@_tool
+def get_cache_stats() -> Dict[str, Any]:
+    """
+    Get connection-cache statistics for this server process.
+
+    Returns:
+        Dictionary with cache hit/miss counts
+    """
+    with _DB_LOCK:
+        return {
+            'success': True,
+            'stats': dict(_CACHE_STATS)
+        }
 
-@mcp.tool()
+@_tool
+@_tool_result
 def add_source(
     title: str,
     source_type: str,
@@ -57,53 +165,43 @@ def add_source(
         add_source("Deep Learning", "book", "isbn", "978-0262035613", 
                   "First Impression", "Comprehensive deep learning textbook")
     """
-    try:
-        # Validate input
-        data = {
-            'title': title,
-            'source_type': source_type,
-            'identifier_type': identifier_type,
-            'identifier_value': identifier_value
+    # Validate input
+    data = {
+        'title': title,
+        'source_type': source_type,
+        'identifier_type': identifier_type,
+        'identifier_value': identifier_value
+    }
+    errors = validate_input_data(data)
+    if errors:
+        return {
+            'success': False,
+            'error': 'Validation failed',
+            'details': errors
         }
-        errors = validate_input_data(data)
-        if errors:
-            return {
-                'success': False,
-                'error': 'Validation failed',
-                'details': errors
-            }
-        
-        db = get_database()
-        
-        # Add the source
+    
+    db = get_database()
+    
+    # One transaction (one fsync) covers the source insert and the
+    # optional initial note
+    with db.transaction():
         source_id = db.add_source(title, source_type, identifier_type, identifier_value)
-        
-        # Add initial note if provided
         if initial_note_title and initial_note_content:
             db.add_note(source_id, initial_note_title, initial_note_content)
-        
-        # Get complete source details
-        source = db.get_source_by_id(source_id)
-        
-        return {
-            'success': True,
-            'message': f'Successfully added {source_type}: {title}',
-            'source': source,
-            'summary': format_source_summary(source)
-        }
-        
-    except DatabaseError as e:
-        return {
-            'success': False,
-            'error': str(e)
-        }
-    except Exception as e:
-        return {
-            'success': False,
-            'error': f'Unexpected error: {str(e)}'
-        }
+    
+    # Get complete source details
+    source = db.get_source_by_id(source_id)
+    
+    return {
+        'success': True,
+        'message': f'Successfully added {source_type}: {title}',
+        'source': source,
+        'summary': format_source_summary(source)
+    }
+    
 
-@mcp.tool()
+@_tool
+@_tool_result
 def add_note(
     title: str,
     source_type: str,
@@ -130,42 +228,30 @@ def add_note(
         add_note("Attention Is All You Need", "paper", "arxiv", "1706.03762",
                 "Key Insights", "The transformer eliminates recurrence...")
     """
-    try:
-        db = get_database()
-        
-        # Find the source
-        source = db.find_source_by_identifier(identifier_type, identifier_value, source_type)
-        if not source:
-            return {
-                'success': False,
-                'error': f'Source not found: {title}'
-            }
-        
-        # Add the note
-        db.add_note(source['id'], note_title, note_content)
-        
-        # Get updated source details
-        updated_source = db.get_source_by_id(source['id'])
-        
-        return {
-            'success': True,
-            'message': f'Added note "{note_title}" to {title}',
-            'source': updated_source,
-            'summary': format_source_summary(updated_source)
-        }
-        
-    except DatabaseError as e:
-        return {
-            'success': False,
-            'error': str(e)
-        }
-    except Exception as e:
+    db = get_database()
+    
+    # Find the source
+    source = db.find_source_by_identifier(identifier_type, identifier_value, source_type)
+    if not source:
         return {
             'success': False,
-            'error': f'Unexpected error: {str(e)}'
+            'error': f'Source not found: {title}'
         }
+    
+    # Add the note; the database call returns the updated source
+    # (notes and links included), so no follow-up read is needed
+    updated_source = db.add_note(source['id'], note_title, note_content)
+    
+    return {
+        'success': True,
+        'message': f'Added note "{note_title}" to {title}',
+        'source': updated_source,
+        'summary': format_source_summary(updated_source)
+    }
+    
 
-@mcp.tool()
+@_tool
+@_tool_result
 def update_status(
     title: str,
     source_type: str,
@@ -189,48 +275,35 @@ def update_status(
     Examples:
         update_status("Attention Is All You Need", "paper", "arxiv", "1706.03762", "completed")
     """
-    try:
-        if new_status not in VALID_STATUS_VALUES:
-            return {
-                'success': False,
-                'error': f'Invalid status. Must be one of: {", ".join(VALID_STATUS_VALUES)}'
-            }
-        
-        db = get_database()
-        
-        # Find the source
-        source = db.find_source_by_identifier(identifier_type, identifier_value, source_type)
-        if not source:
-            return {
-                'success': False,
-                'error': f'Source not found: {title}'
-            }
-        
-        # Update status
-        db.update_status(source['id'], new_status)
-        
-        # Get updated source details
-        updated_source = db.get_source_by_id(source['id'])
-        
-        return {
-            'success': True,
-            'message': f'Updated status of "{title}" to {new_status}',
-            'source': updated_source,
-            'summary': format_source_summary(updated_source)
-        }
-        
-    except DatabaseError as e:
+    if new_status not in VALID_STATUS_VALUES:
         return {
             'success': False,
-            'error': str(e)
+            'error': f'Invalid status. Must be one of: {VALID_STATUS_VALUES_STR}'
         }
-    except Exception as e:
+    
+    db = get_database()
+    
+    # Find the source
+    source = db.find_source_by_identifier(identifier_type, identifier_value, source_type)
+    if not source:
         return {
             'success': False,
-            'error': f'Unexpected error: {str(e)}'
+            'error': f'Source not found: {title}'
         }
+    
+    # Update status; the database call returns the updated source
+    updated_source = db.update_status(source['id'], new_status)
+    
+    return {
+        'success': True,
+        'message': f'Updated status of "{title}" to {new_status}',
+        'source': updated_source,
+        'summary': format_source_summary(updated_source)
+    }
+    
 
-@mcp.tool()
+@_tool
+@_tool_result
 def link_to_entity(
     title: str,
     source_type: str,
@@ -260,53 +333,41 @@ def link_to_entity(
                       "transformer architecture", "introduces", 
                       "First paper to introduce the transformer model")
     """
-    try:
-        if relation_type not in VALID_RELATION_TYPES:
-            return {
-                'success': False,
-                'error': f'Invalid relation type. Must be one of: {", ".join(VALID_RELATION_TYPES)}'
-            }
-        
-        db = get_database()
-        
-        # Find the source
-        source = db.find_source_by_identifier(identifier_type, identifier_value, source_type)
-        if not source:
-            return {
-                'success': False,
-                'error': f'Source not found: {title}'
-            }
-        
-        # Create the link
-        db.link_to_entity(source['id'], entity_name, relation_type, notes)
-        
-        # Get updated source details
-        updated_source = db.get_source_by_id(source['id'])
-        
-        return {
-            'success': True,
-            'message': f'Linked "{title}" to entity "{entity_name}" with relation "{relation_type}"',
-            'source': updated_source,
-            'summary': format_source_summary(updated_source)
-        }
-        
-    except DatabaseError as e:
+    if relation_type not in VALID_RELATION_TYPES:
         return {
             'success': False,
-            'error': str(e)
+            'error': f'Invalid relation type. Must be one of: {VALID_RELATION_TYPES_STR}'
         }
-    except Exception as e:
+    
+    db = get_database()
+    
+    # Find the source
+    source = db.find_source_by_identifier(identifier_type, identifier_value, source_type)
+    if not source:
         return {
             'success': False,
-            'error': f'Unexpected error: {str(e)}'
+            'error': f'Source not found: {title}'
         }
+    
+    # Create the link; the database call returns the updated source
+    updated_source = db.link_to_entity(source['id'], entity_name, relation_type, notes)
+    
+    return {
+        'success': True,
+        'message': f'Linked "{title}" to entity "{entity_name}" with relation "{relation_type}"',
+        'source': updated_source,
+        'summary': format_source_summary(updated_source)
+    }
+    
 
-@mcp.tool()
+@_tool
+@_tool_result
 def get_source_details(
     title: str,
     source_type: str,
     identifier_type: str,
-    identifier_value: str
+    identifier_value: str,
+    max_note_length: int = 8192
 ) -> Dict[str, Any]:
     """
     Get complete details about a source including notes and entity links.
@@ -316,6 +377,8 @@ def get_source_details(
         source_type: Type of source
         identifier_type: Type of identifier
         identifier_value: Value of the identifier
+        max_note_length: Truncate note contents longer than this many
+            characters (0 disables truncation)
     
     Returns:
         Dictionary with source details
@@ -323,38 +386,36 @@ def get_source_details(
     Examples:
         get_source_details("Attention Is All You Need", "paper", "arxiv", "1706.03762")
     """
-    try:
-        db = get_database()
-        
-        # Find the source
-        source = db.find_source_by_identifier(identifier_type, identifier_value, source_type)
-        if not source:
-            return {
-                'success': False,
-                'error': f'Source not found: {title}'
-            }
-        
-        # Get complete details
-        complete_source = db.get_source_by_id(source['id'])
-        
-        return {
-            'success': True,
-            'source': complete_source,
-            'summary': format_source_summary(complete_source)
-        }
-        
-    except DatabaseError as e:
-        return {
-            'success': False,
-            'error': str(e)
-        }
-    except Exception as e:
+    db = get_database()
+    
+    # One query resolves the identifier and loads the full payload
+    complete_source = db.find_full_source_by_identifier(
+        identifier_type, identifier_value, source_type)
+    if not complete_source:
         return {
             'success': False,
-            'error': f'Unexpected error: {str(e)}'
+            'error': f'Source not found: {title}'
         }
+    
+    # Bound the response size: very long note contents are clipped and
+    # flagged, so a single source cannot blow out the MCP payload
+    if max_note_length > 0:
+        for note in complete_source['notes']:
+            content = note['content']
+            if len(content) > max_note_length:
+                note['content'] = content[:max_note_length] + '…'
+                note['truncated'] = True
+                note['full_length'] = len(content)
+    
+    return {
+        'success': True,
+        'source': complete_source,
+        'summary': format_source_summary(complete_source)
+    }
+    
 
-@mcp.tool()
+@_tool
+@_tool_result
 def list_sources(
     source_type: Optional[str] = None,
     status: Optional[str] = None,
@@ -376,53 +437,43 @@ def list_sources(
         list_sources(source_type="paper")  # List only papers
         list_sources(status="unread", limit=10)  # List 10 unread sources
     """
-    try:
-        db = get_database()
-        
-        # Validate filters
-        if source_type and source_type not in VALID_SOURCE_TYPES:
-            return {
-                'success': False,
-                'error': f'Invalid source type. Must be one of: {", ".join(VALID_SOURCE_TYPES)}'
-            }
-        
-        if status and status not in VALID_STATUS_VALUES:
-            return {
-                'success': False,
-                'error': f'Invalid status. Must be one of: {", ".join(VALID_STATUS_VALUES)}'
-            }
-        
-        # Get sources
-        sources = db.list_sources(source_type, status, limit)
-        
-        # Create summary
-        filter_desc = []
-        if source_type:
-            filter_desc.append(f"type={source_type}")
-        if status:
-            filter_desc.append(f"status={status}")
-        
-        filter_text = f" (filtered by {', '.join(filter_desc)})" if filter_desc else ""
-        
-        return {
-            'success': True,
-            'message': f'Found {len(sources)} sources{filter_text}',
-            'sources': sources,
-            'count': len(sources)
-        }
-        
-    except DatabaseError as e:
+    db = get_database()
+    
+    # Validate filters
+    if source_type and source_type not in VALID_SOURCE_TYPES:
         return {
             'success': False,
-            'error': str(e)
+            'error': f'Invalid source type. Must be one of: {VALID_SOURCE_TYPES_STR}'
         }
-    except Exception as e:
+    
+    if status and status not in VALID_STATUS_VALUES:
         return {
             'success': False,
-            'error': f'Unexpected error: {str(e)}'
+            'error': f'Invalid status. Must be one of: {VALID_STATUS_VALUES_STR}'
         }
+    
+    # Get sources
+    sources = db.list_sources(source_type, status, limit)
+    
+    # Create summary
+    filter_desc = []
+    if source_type:
+        filter_desc.append(f"type={source_type}")
+    if status:
+        filter_desc.append(f"status={status}")
+    
+    filter_text = f" (filtered by {', '.join(filter_desc)})" if filter_desc else ""
+    
+    return {
+        'success': True,
+        'message': f'Found {len(sources)} sources{filter_text}',
+        'sources': sources,
+        'count': len(sources)
+    }
+    
 
-@mcp.tool()
+@_tool
+@_tool_result
 def search_sources(query: str, limit: int = 10) -> Dict[str, Any]:
     """
     Search sources by title.
@@ -438,36 +489,23 @@ def search_sources(query: str, limit: int = 10) -> Dict[str, Any]:
         search_sources("transformer")
         search_sources("deep learning", limit=5)
     """
-    try:
-        db = get_database()
-        
-        # Get all sources and search
-        all_sources = db.list_sources(limit=1000)  # Get more for searching
-        matches = search_sources_by_title(all_sources, query)
-        
-        # Limit results
-        limited_matches = matches[:limit]
-        
-        return {
-            'success': True,
-            'message': f'Found {len(limited_matches)} sources matching "{query}"',
-            'sources': limited_matches,
-            'query': query,
-            'count': len(limited_matches)
-        }
-        
-    except DatabaseError as e:
-        return {
-            'success': False,
-            'error': str(e)
-        }
-    except Exception as e:
-        return {
-            'success': False,
-            'error': f'Unexpected error: {str(e)}'
-        }
+    db = get_database()
+    
+    # Search in SQL via the FTS5 index (LIKE fallback for older
+    # databases), so only the matching rows cross into Python
+    matches = db.search_by_title(query, limit)
+    
+    return {
+        'success': True,
+        'message': f'Found {len(matches)} sources matching "{query}"',
+        'sources': matches,
+        'query': query,
+        'count': len(matches)
+    }
+    
 
-@mcp.tool()
+@_tool
+@_tool_result
 def database_stats() -> Dict[str, Any]:
     """
     Get statistics about your literature database.
@@ -478,45 +516,42 @@ def database_stats() -> Dict[str, Any]:
     Examples:
         database_stats()
     """
-    try:
-        db = get_database()
-        stats = db.get_database_stats()
-        
-        # Format the stats nicely
-        summary_lines = []
-        summary_lines.append(f"📊 Database Statistics")
-        summary_lines.append(f"Total Sources: {stats['total_sources']}")
-        summary_lines.append(f"Total Notes: {stats['total_notes']}")
-        summary_lines.append(f"Total Entity Links: {stats['total_entity_links']}")
-        
-        if stats['sources_by_type']:
-            summary_lines.append("\nSources by Type:")
-            for source_type, count in stats['sources_by_type'].items():
-                summary_lines.append(f"  {source_type.title()}: {count}")
-        
-        if stats['sources_by_status']:
-            summary_lines.append("\nSources by Status:")
-            for status, count in stats['sources_by_status'].items():
-                summary_lines.append(f"  {status.title()}: {count}")
-        
-        return {
-            'success': True,
-            'stats': stats,
-            'summary': '\n'.join(summary_lines)
-        }
-        
-    except DatabaseError as e:
-        return {
-            'success': False,
-            'error': str(e)
-        }
-    except Exception as e:
-        return {
-            'success': False,
-            'error': f'Unexpected error: {str(e)}'
-        }
+    db = get_database()
+    now = time.monotonic()
+    with _STATS_LOCK:
+        if (_STATS_CACHE['stats'] is not None
+                and now - _STATS_CACHE['at'] < _STATS_TTL_SECONDS):
+            stats = _STATS_CACHE['stats']
+            summary = _STATS_CACHE['summary']
+        else:
+            stats = db.get_database_stats()
+            # Render once per cache window; STATUS_DISPLAY/TYPE_DISPLAY
+            # hold pre-title-cased names
+            summary = '\n'.join(
+                ["📊 Database Statistics",
+                 f"Total Sources: {stats['total_sources']}",
+                 f"Total Notes: {stats['total_notes']}",
+                 f"Total Entity Links: {stats['total_entity_links']}"]
+                + (["\nSources by Type:"]
+                   + [f"  {TYPE_DISPLAY.get(t, t.title())}: {c}"
+                      for t, c in stats['sources_by_type'].items()]
+                   if stats['sources_by_type'] else [])
+                + (["\nSources by Status:"]
+                   + [f"  {STATUS_DISPLAY.get(st, st.title())}: {c}"
+                      for st, c in stats['sources_by_status'].items()]
+                   if stats['sources_by_status'] else []))
+            _STATS_CACHE['at'] = now
+            _STATS_CACHE['stats'] = stats
+            _STATS_CACHE['summary'] = summary
+    
+    return {
+        'success': True,
+        'stats': stats,
+        'summary': summary
+    }
+    
 
-@mcp.tool()
+@_tool
 def get_help() -> Dict[str, Any]:
     """
     Get help information about available commands and usage.
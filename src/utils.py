@@ -4,9 +4,25 @@ Utility Functions for Literature Manager
 This module contains helper functions used throughout the application.
 """
 
+import heapq
 import re
 from typing import List, Dict, Any, Optional, Tuple
-from .models import VALID_SOURCE_TYPES, VALID_IDENTIFIER_TYPES
+from urllib.parse import urlsplit
+from .models import VALID_SOURCE_TYPES, VALID_IDENTIFIER_TYPES, TYPE_DISPLAY, STATUS_DISPLAY
+
+# Patterns compiled once at import; these run on every add_source call
+_WHITESPACE_RE = re.compile(r'\s+')
+_LEADING_ARTICLE_RE = re.compile(r'^(A|An|The)\s+', re.IGNORECASE)
+# Both arXiv formats in one alternation, so a miss costs one scan
+_ARXIV_RE = re.compile(
+    r'(?:arxiv:)?(\d{4}\.\d{4,5}(?:v\d+)?'          # New format: 1234.5678v1
+    r'|[a-z-]+(?:\.[A-Z]{2})?/\d{7}(?:v\d+)?)',      # Old format: math.CO/0123456v1
+    re.IGNORECASE)
+_DOI_RE = re.compile(r'(?:doi:)?(10\.\d+/[^\s]+)', re.IGNORECASE)
+# Deletion table keeping only digits and X; str.translate walks the
+# string once in C, cheaper than a character-class regex
+_ISBN_KEEP = str.maketrans('', '', ''.join(
+    chr(c) for c in range(256) if chr(c) not in '0123456789X'))
 
 def clean_title(title: str) -> str:
     """
@@ -19,10 +35,10 @@ def clean_title(title: str) -> str:
         str: Cleaned title
     """
     # Remove extra whitespace
-    title = re.sub(r'\s+', ' ', title.strip())
+    title = _WHITESPACE_RE.sub(' ', title.strip())
     
     # Remove common prefixes/suffixes
-    title = re.sub(r'^(A|An|The)\s+', '', title, flags=re.IGNORECASE)
+    title = _LEADING_ARTICLE_RE.sub('', title)
     
     return title
 
@@ -36,17 +52,9 @@ def extract_arxiv_id(text: str) -> Optional[str]:
     Returns:
         str: arXiv ID if found, None otherwise
     """
-    # Pattern for arXiv IDs (both old and new formats)
-    patterns = [
-        r'(?:arxiv:)?(\d{4}\.\d{4,5}(?:v\d+)?)',  # New format: 1234.5678v1
-        r'(?:arxiv:)?([a-z-]+(?:\.[A-Z]{2})?/\d{7}(?:v\d+)?)'  # Old format: math.CO/0123456v1
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            return match.group(1)
-    
+    match = _ARXIV_RE.search(text)
+    if match:
+        return match.group(1)
     return None
 
 def extract_doi(text: str) -> Optional[str]:
@@ -59,9 +67,7 @@ def extract_doi(text: str) -> Optional[str]:
     Returns:
         str: DOI if found, None otherwise
     """
-    # DOI pattern
-    pattern = r'(?:doi:)?(10\.\d+/[^\s]+)'
-    match = re.search(pattern, text, re.IGNORECASE)
+    match = _DOI_RE.search(text)
     if match:
         return match.group(1)
     return None
@@ -77,7 +83,11 @@ def extract_isbn(text: str) -> Optional[str]:
         str: ISBN if found, None otherwise
     """
     # Remove all non-digit characters except X
-    cleaned = re.sub(r'[^\dX]', '', text.upper())
+    cleaned = text.upper().translate(_ISBN_KEEP)
+    if not cleaned.isascii():
+        # The deletion table only covers Latin-1; strip anything the
+        # fast path let through (em-dashes and similar paste artifacts)
+        cleaned = ''.join(c for c in cleaned if c in '0123456789X')
     
     # Check for ISBN-13 (13 digits)
     if len(cleaned) == 13 and cleaned.startswith(('978', '979')):
@@ -99,15 +109,31 @@ def validate_url(url: str) -> bool:
     Returns:
         bool: True if valid URL
     """
-    url_pattern = re.compile(
-        r'^https?://'  # http:// or https://
-        r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
-        r'localhost|'  # localhost...
-        r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
-        r'(?::\d+)?'  # optional port
-        r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-    
-    return url_pattern.match(url) is not None
+    # urlsplit is C-backed and immune to regex backtracking on long
+    # user-supplied values; a usable URL needs an http(s) scheme and a host
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        # e.g. malformed IPv6 brackets; not a valid URL either way
+        return False
+    return parts.scheme in ('http', 'https') and bool(parts.netloc)
+
+# Built once: identifier kinds that imply a source type, and title
+# keywords in priority order (papers before books before videos)
+_IDENTIFIER_TYPE_GUESSES = {
+    'arxiv': 'paper',
+    'doi': 'paper',
+    'semantic_scholar': 'paper',
+    'isbn': 'book',
+    'url': 'webpage'
+}
+
+_TITLE_KEYWORD_GUESSES = (
+    ('paper', 'paper'), ('article', 'paper'), ('journal', 'paper'), ('conference', 'paper'),
+    ('book', 'book'), ('textbook', 'book'), ('handbook', 'book'),
+    ('video', 'video'), ('lecture', 'video'), ('tutorial', 'video'),
+    ('blog', 'blog'), ('post', 'blog'),
+)
 
 def guess_source_type(title: str, identifier_type: str, identifier_value: str) -> str:
     """
@@ -121,29 +147,15 @@ def guess_source_type(title: str, identifier_type: str, identifier_value: str) -
     Returns:
         str: Guessed source type
     """
-    # Map identifier types to likely source types
-    identifier_mapping = {
-        'arxiv': 'paper',
-        'doi': 'paper',
-        'semantic_scholar': 'paper',
-        'isbn': 'book',
-        'url': 'webpage'
-    }
+    guessed = _IDENTIFIER_TYPE_GUESSES.get(identifier_type)
+    if guessed:
+        return guessed
     
-    if identifier_type in identifier_mapping:
-        return identifier_mapping[identifier_type]
-    
-    # Guess from title keywords
+    # Guess from title keywords in one pass over the precomputed pairs
     title_lower = title.lower()
-    
-    if any(word in title_lower for word in ['paper', 'article', 'journal', 'conference']):
-        return 'paper'
-    elif any(word in title_lower for word in ['book', 'textbook', 'handbook']):
-        return 'book'
-    elif any(word in title_lower for word in ['video', 'lecture', 'tutorial']):
-        return 'video'
-    elif any(word in title_lower for word in ['blog', 'post']):
-        return 'blog'
+    for keyword, source_type in _TITLE_KEYWORD_GUESSES:
+        if keyword in title_lower:
+            return source_type
     
     # Default to webpage
     return 'webpage'
@@ -158,18 +170,21 @@ def format_source_summary(source: Dict[str, Any]) -> str:
     Returns:
         str: Formatted summary
     """
-    lines = []
-    lines.append(f"📚 {source['title']}")
-    lines.append(f"   Type: {source['type'].title()}")
-    lines.append(f"   Status: {source['status'].title()}")
-    
-    # Show identifiers
-    if source.get('identifiers'):
-        id_parts = []
-        for id_type, id_value in source['identifiers'].items():
-            id_parts.append(f"{id_type}: {id_value}")
-        lines.append(f"   IDs: {', '.join(id_parts)}")
-    
+    # Build every line once, then join; no intermediate concatenation
+    lines = [
+        f"📚 {source['title']}",
+        f"   Type: {TYPE_DISPLAY.get(source['type'], source['type'].title())}",
+        f"   Status: {STATUS_DISPLAY.get(source['status'], source['status'].title())}",
+    ]
+
+    # Show identifiers; prefer the display string already built by SQLite
+    id_text = source.get('identifiers_text')
+    if not id_text and source.get('identifiers'):
+        id_text = ', '.join(f"{id_type}: {id_value}"
+                            for id_type, id_value in source['identifiers'].items())
+    if id_text:
+        lines.append(f"   IDs: {id_text}")
+
     # Show note count
     note_count = len(source.get('notes', []))
     if note_count > 0:
@@ -182,43 +197,54 @@ def format_source_summary(source: Dict[str, Any]) -> str:
     
     return '\n'.join(lines)
 
-def search_sources_by_title(sources: List[Dict[str, Any]], query: str) -> List[Dict[str, Any]]:
+def search_sources_by_title(sources: List[Dict[str, Any]], query: str,
+                            limit: Optional[int] = None) -> List[Dict[str, Any]]:
     """
     Search sources by title using fuzzy matching.
     
     Args:
         sources: List of source dictionaries
         query: Search query
+        limit: Optional cap on the number of results
         
     Returns:
         List of matching sources, sorted by relevance
     """
+    # Query invariants hoisted out of the loop
     query_lower = query.lower()
+    query_words = tuple(query_lower.split())
     matches = []
     
-    for source in sources:
+    for index, source in enumerate(sources):
         title_lower = source['title'].lower()
         
-        # Exact match gets highest score
+        # Exact match gets highest score, contains medium, word match low
         if query_lower == title_lower:
-            matches.append((source, 100))
-        # Contains query gets medium score
+            score = 100
         elif query_lower in title_lower:
-            matches.append((source, 50))
-        # Word match gets lower score
-        elif any(word in title_lower for word in query_lower.split()):
-            matches.append((source, 25))
-    
-    # Sort by score (descending) and return sources
-    matches.sort(key=lambda x: x[1], reverse=True)
-    return [match[0] for match in matches]
+            score = 50
+        elif any(word in title_lower for word in query_words):
+            score = 25
+        else:
+            continue
+        # -index keeps ties in input order; scores+indexes are unique,
+        # so tuple comparison never touches the dict
+        matches.append((score, -index, source))
+    
+    if limit is not None:
+        # O(n log limit) instead of sorting every match
+        return [match[2] for match in heapq.nlargest(limit, matches)]
+    
+    matches.sort(reverse=True)
+    return [match[2] for match in matches]
 
-def validate_input_data(data: Dict[str, Any]) -> List[str]:
+def validate_input_data(data: Dict[str, Any], fast_fail: bool = False) -> List[str]:
     """
     Validate input data and return list of errors.
     
     Args:
         data: Dictionary with input data
+        fast_fail: Stop after the missing-field check if it already failed
         
     Returns:
         List of error messages (empty if valid)
@@ -231,6 +257,11 @@ def validate_input_data(data: Dict[str, Any]) -> List[str]:
         if field not in data or not data[field]:
             errors.append(f"Missing required field: {field}")
     
+    # With fields missing, the value checks below add nothing a caller
+    # that opted in needs to see
+    if fast_fail and errors:
+        return errors
+    
     # Validate source type
     if 'source_type' in data and data['source_type'] not in VALID_SOURCE_TYPES:
         errors.append(f"Invalid source type: {data['source_type']}")
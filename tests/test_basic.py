@@ -7,81 +7,119 @@ Run with: python -m pytest tests/test_basic.py
 """
 
 import unittest
-import tempfile
 import os
 import sqlite3
 import json
+import uuid
 from pathlib import Path
 import sys
 
-# Add src directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Make the repo root importable when this file is run directly; under
+# "python -m unittest" from the root this is a no-op
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.database import LiteratureDatabase, DatabaseError
 from src.models import VALID_SOURCE_TYPES, VALID_IDENTIFIER_TYPES
 from src.utils import clean_title, extract_arxiv_id, validate_url
 
+# Test schema, parsed once per run instead of rebuilt per test.
+# Mirrors the production DDL from setup_database.py (generated
+# identifier columns, partial indexes, FTS) so the tests exercise the
+# indexed-probe and FTS code paths rather than only their fallbacks.
+_SCHEMA_SQL = """
+    CREATE TABLE sources (
+        id TEXT PRIMARY KEY,
+        title TEXT NOT NULL,
+        type TEXT CHECK(type IN ('paper', 'webpage', 'book', 'video', 'blog')) NOT NULL,
+        identifiers TEXT NOT NULL,
+        status TEXT CHECK(status IN ('unread', 'reading', 'completed', 'archived')) DEFAULT 'unread',
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        semantic_scholar_id TEXT GENERATED ALWAYS AS (json_extract(identifiers, '$.semantic_scholar')) STORED,
+        arxiv_id TEXT GENERATED ALWAYS AS (json_extract(identifiers, '$.arxiv')) STORED,
+        doi_id TEXT GENERATED ALWAYS AS (json_extract(identifiers, '$.doi')) STORED,
+        isbn_id TEXT GENERATED ALWAYS AS (json_extract(identifiers, '$.isbn')) STORED,
+        url_id TEXT GENERATED ALWAYS AS (json_extract(identifiers, '$.url')) STORED
+    );
+
+    CREATE TABLE source_notes (
+        source_id TEXT REFERENCES sources(id),
+        note_title TEXT NOT NULL,
+        content TEXT NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (source_id, note_title)
+    );
+
+    CREATE TABLE source_entity_links (
+        source_id TEXT REFERENCES sources(id),
+        entity_name TEXT,
+        relation_type TEXT CHECK(relation_type IN ('discusses', 'introduces', 'extends', 'evaluates', 'applies', 'critiques')),
+        notes TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (source_id, entity_name)
+    );
+
+    CREATE INDEX idx_sources_type ON sources(type);
+    CREATE INDEX idx_sources_type_status_created ON sources(type, status, created_at DESC);
+    CREATE INDEX idx_sources_status_created ON sources(status, created_at DESC);
+    CREATE INDEX idx_entity_links_name ON source_entity_links(entity_name);
+    CREATE INDEX idx_sources_arxiv_id ON sources(arxiv_id) WHERE arxiv_id IS NOT NULL;
+    CREATE INDEX idx_sources_isbn_id ON sources(isbn_id) WHERE isbn_id IS NOT NULL;
+    CREATE INDEX idx_sources_url_id ON sources(url_id) WHERE url_id IS NOT NULL;
+
+    CREATE VIRTUAL TABLE sources_fts USING fts5(
+        title,
+        content='sources',
+        content_rowid='rowid',
+        tokenize='unicode61'
+    );
+
+    CREATE TRIGGER sources_fts_insert AFTER INSERT ON sources BEGIN
+        INSERT INTO sources_fts(rowid, title) VALUES (new.rowid, new.title);
+    END;
+
+    CREATE TRIGGER sources_fts_delete AFTER DELETE ON sources BEGIN
+        INSERT INTO sources_fts(sources_fts, rowid, title)
+        VALUES ('delete', old.rowid, old.title);
+    END;
+
+    CREATE TRIGGER sources_fts_update AFTER UPDATE OF title ON sources BEGIN
+        INSERT INTO sources_fts(sources_fts, rowid, title)
+        VALUES ('delete', old.rowid, old.title);
+        INSERT INTO sources_fts(rowid, title) VALUES (new.rowid, new.title);
+    END;
+"""
+
 class TestDatabase(unittest.TestCase):
     """Test database operations."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Create one shared in-memory database with the schema."""
+        # The pinned connection keeps the shared-cache database (and the
+        # schema built into it) alive for the whole test class.
+        cls.db_path = f"file:testdb_{uuid.uuid4().hex}?mode=memory&cache=shared"
+        cls._pin = sqlite3.connect(cls.db_path, uri=True)
+        cls._pin.executescript(_SCHEMA_SQL)
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Drop the shared in-memory database."""
+        cls._pin.close()
+    
     def setUp(self):
         """Set up test database for each test."""
-        # Create temporary database
-        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
-        self.temp_db.close()
-        self.db_path = self.temp_db.name
-        
-        # Create database schema
-        self._create_test_database()
-        
-        # Initialize database instance
+        # Each test runs inside one transaction that tearDown rolls
+        # back, so the shared schema is reused but no rows leak between
+        # tests. Holding _in_txn keeps the database methods from
+        # committing mid-test.
         self.db = LiteratureDatabase(self.db_path)
+        self.db._conn.execute("BEGIN")
+        self.db._in_txn = True
     
     def tearDown(self):
-        """Clean up after each test."""
-        # Remove temporary database
-        if os.path.exists(self.db_path):
-            os.unlink(self.db_path)
-    
-    def _create_test_database(self):
-        """Create test database with schema."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            # Create tables
-            cursor.execute("""
-                CREATE TABLE sources (
-                    id TEXT PRIMARY KEY,
-                    title TEXT NOT NULL,
-                    type TEXT CHECK(type IN ('paper', 'webpage', 'book', 'video', 'blog')) NOT NULL,
-                    identifiers TEXT NOT NULL,
-                    status TEXT CHECK(status IN ('unread', 'reading', 'completed', 'archived')) DEFAULT 'unread',
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            cursor.execute("""
-                CREATE TABLE source_notes (
-                    source_id TEXT REFERENCES sources(id),
-                    note_title TEXT NOT NULL,
-                    content TEXT NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    PRIMARY KEY (source_id, note_title)
-                )
-            """)
-            
-            cursor.execute("""
-                CREATE TABLE source_entity_links (
-                    source_id TEXT REFERENCES sources(id),
-                    entity_name TEXT,
-                    relation_type TEXT CHECK(relation_type IN ('discusses', 'introduces', 'extends', 'evaluates', 'applies', 'critiques')),
-                    notes TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    PRIMARY KEY (source_id, entity_name)
-                )
-            """)
-            
-            conn.commit()
+        """Roll back everything the test wrote."""
+        self.db._conn.rollback()
+        self.db.close()
     
     def test_add_source_success(self):
         """Test successful source addition."""
@@ -93,7 +131,8 @@ class TestDatabase(unittest.TestCase):
         )
         
         self.assertIsInstance(source_id, str)
-        self.assertEqual(len(source_id), 36)  # UUID length
+        self.assertEqual(len(source_id), 32)  # undashed UUID hex length
+        uuid.UUID(source_id)  # raises ValueError if not a valid UUID
         
         # Verify source was added
         source = self.db.get_source_by_id(source_id)
@@ -102,15 +141,30 @@ class TestDatabase(unittest.TestCase):
         self.assertEqual(source['type'], "paper")
         self.assertEqual(source['identifiers']['arxiv'], "1234.5678")
     
-    def test_add_source_invalid_type(self):
-        """Test adding source with invalid type."""
-        with self.assertRaises(DatabaseError):
-            self.db.add_source(
-                title="Test",
-                source_type="invalid_type",
-                identifier_type="arxiv",
-                identifier_value="1234.5678"
-            )
+    def test_invalid_inputs(self):
+        """Test that bad inputs raise DatabaseError."""
+        # One shared source for the failure cases below, so the
+        # bootstrap insert happens once instead of once per case
+        source_id = self.db.add_source(
+            title="Test Paper",
+            source_type="paper",
+            identifier_type="arxiv",
+            identifier_value="1234.5678"
+        )
+        self.db.add_note(source_id, "Test Note", "First note")
+        
+        cases = [
+            ("invalid source type", self.db.add_source,
+             ("Test", "invalid_type", "arxiv", "1234.5678")),
+            ("invalid status", self.db.update_status,
+             (source_id, "invalid_status")),
+            ("duplicate note title", self.db.add_note,
+             (source_id, "Test Note", "Second note")),
+        ]
+        for label, method, args in cases:
+            with self.subTest(label):
+                with self.assertRaises(DatabaseError):
+                    method(*args)
     
     def test_add_source_duplicate(self):
         """Test adding duplicate source."""
@@ -171,23 +225,6 @@ class TestDatabase(unittest.TestCase):
         self.assertEqual(source['notes'][0]['title'], "Test Note")
         self.assertEqual(source['notes'][0]['content'], "This is a test note")
     
-    def test_add_note_duplicate_title(self):
-        """Test adding note with duplicate title."""
-        # Add source
-        source_id = self.db.add_source(
-            title="Test Paper",
-            source_type="paper",
-            identifier_type="arxiv",
-            identifier_value="1234.5678"
-        )
-        
-        # Add first note
-        self.db.add_note(source_id, "Test Note", "First note")
-        
-        # Try to add note with same title
-        with self.assertRaises(DatabaseError):
-            self.db.add_note(source_id, "Test Note", "Second note")
-    
     def test_update_status(self):
         """Test status update."""
         # Add source
@@ -206,20 +243,6 @@ class TestDatabase(unittest.TestCase):
         source = self.db.get_source_by_id(source_id)
         self.assertEqual(source['status'], "completed")
     
-    def test_update_status_invalid(self):
-        """Test updating to invalid status."""
-        # Add source
-        source_id = self.db.add_source(
-            title="Test Paper",
-            source_type="paper",
-            identifier_type="arxiv",
-            identifier_value="1234.5678"
-        )
-        
-        # Try invalid status
-        with self.assertRaises(DatabaseError):
-            self.db.update_status(source_id, "invalid_status")
-    
     def test_link_to_entity(self):
         """Test entity linking."""
         # Add source
@@ -247,10 +270,13 @@ class TestDatabase(unittest.TestCase):
     
     def test_list_sources(self):
         """Test listing sources."""
-        # Add multiple sources
-        self.db.add_source("Paper 1", "paper", "arxiv", "1111.1111")
-        self.db.add_source("Book 1", "book", "isbn", "978-1111111111")
-        self.db.add_source("Paper 2", "paper", "arxiv", "2222.2222")
+        # Add multiple sources in one batched statement
+        created = self.db.add_sources_bulk([
+            ("Paper 1", "paper", "arxiv", "1111.1111"),
+            ("Book 1", "book", "isbn", "978-1111111111"),
+            ("Paper 2", "paper", "arxiv", "2222.2222"),
+        ])
+        self.assertEqual(len(created), 3)
         
         # List all sources
         all_sources = self.db.list_sources()
@@ -280,6 +306,88 @@ class TestDatabase(unittest.TestCase):
         self.assertIn('paper', stats['sources_by_type'])
         self.assertEqual(stats['sources_by_type']['paper'], 1)
 
+class TestTransactions(unittest.TestCase):
+    """Test transaction grouping and the bulk APIs."""
+    
+    def setUp(self):
+        """Set up a private database (no fixture transaction open)."""
+        self.db_path = f"file:testtxn_{uuid.uuid4().hex}?mode=memory&cache=shared"
+        self._pin = sqlite3.connect(self.db_path, uri=True)
+        self._pin.executescript(_SCHEMA_SQL)
+        self.db = LiteratureDatabase(self.db_path)
+    
+    def tearDown(self):
+        """Drop the private database."""
+        self.db.close()
+        self._pin.close()
+    
+    def test_transaction_rollback(self):
+        """Test that a failed transaction undoes every write in it."""
+        with self.assertRaises(RuntimeError):
+            with self.db.transaction():
+                source_id = self.db.add_source(
+                    "Doomed Paper", "paper", "arxiv", "1234.5678")
+                self.db.add_notes_bulk([(source_id, "Note", "Content")])
+                # Lookup inside the block must not leave a stale cache hit
+                self.assertIsNotNone(self.db.find_source_by_identifier(
+                    "arxiv", "1234.5678", "paper"))
+                raise RuntimeError("abort")
+        
+        # Nothing from the block survives the rollback
+        self.assertIsNone(self.db.find_source_by_identifier(
+            "arxiv", "1234.5678", "paper"))
+        stats = self.db.get_database_stats()
+        self.assertEqual(stats['total_sources'], 0)
+        self.assertEqual(stats['total_notes'], 0)
+    
+    def test_failed_write_leaves_no_open_transaction(self):
+        """Test that a failed mutation does not pin a stale transaction."""
+        source_id = self.db.add_source("Paper", "paper", "arxiv", "1234.5678")
+        self.db.add_note(source_id, "Note", "Content")
+        
+        # Duplicate note fails, but must roll back its implicit
+        # transaction on the persistent connection
+        with self.assertRaises(DatabaseError):
+            self.db.add_note(source_id, "Note", "Again")
+        self.assertFalse(self.db._conn.in_transaction)
+        
+        # A transaction() block right after the failure must still work
+        with self.db.transaction():
+            self.db.add_source("Second", "paper", "arxiv", "9999.8888")
+        self.assertIsNotNone(self.db.find_source_by_identifier(
+            "arxiv", "9999.8888", "paper"))
+    
+    def test_bulk_import(self):
+        """Test importing sources with notes and links in one call."""
+        created = self.db.bulk_import([
+            {
+                'title': "Bulk Paper",
+                'source_type': "paper",
+                'identifier_type': "arxiv",
+                'identifier_value': "1111.2222",
+                'notes': [("Summary", "Imported in bulk")],
+                'entities': [("transformers", "discusses")],
+            },
+            {
+                'title': "Bulk Book",
+                'source_type': "book",
+                'identifier_type': "isbn",
+                'identifier_value': "978-1111111111",
+            },
+        ])
+        self.assertEqual(len(created), 2)
+        
+        source = self.db.get_source_by_id(created[0])
+        self.assertEqual(source['title'], "Bulk Paper")
+        self.assertEqual(len(source['notes']), 1)
+        self.assertEqual(len(source['entity_links']), 1)
+        
+        # The imported rows are visible to identifier lookup and search
+        found = self.db.find_source_by_identifier("isbn", "978-1111111111", "book")
+        self.assertEqual(found['id'], created[1])
+        titles = [match['title'] for match in self.db.search_by_title("bulk")]
+        self.assertIn("Bulk Paper", titles)
+
 class TestUtils(unittest.TestCase):
     """Test utility functions."""
     